@@ -6,16 +6,42 @@ Modules:
     l0_orchestrator: Layer 0 / Consortium Blockchain orchestrator for digital monopoly control
     architect_prime: AI Strategist & Procedural Architect for sovereign infrastructure design
     qin_systems_engineer: Lead AI Systems Engineer for Quantum Information Network blueprints
+
+Agent classes are resolved lazily (PEP 562) so importing the package only
+loads the submodules that are actually used.
 """
 
-from agents.defi_agent import DeFiAgent, AgentConfig, DEFI_AGENT_SYSTEM_PROMPT
-from agents.l0_orchestrator import L0OrchestratorAgent, OrchestratorConfig, L0_ORCHESTRATOR_SYSTEM_PROMPT
-from agents.architect_prime import ArchitectPrimeAgent, ArchitectConfig
-from agents.qin_systems_engineer import QINSystemsEngineerAgent, QINConfig
+import importlib
+import importlib.util
 
-__all__ = [
-    "DeFiAgent", "AgentConfig", "DEFI_AGENT_SYSTEM_PROMPT",
-    "L0OrchestratorAgent", "OrchestratorConfig", "L0_ORCHESTRATOR_SYSTEM_PROMPT",
-    "ArchitectPrimeAgent", "ArchitectConfig",
-    "QINSystemsEngineerAgent", "QINConfig",
+# (submodule, exported names) — the single source for __all__ and the lazy table
+_CANDIDATES = [
+    ("defi_agent", ["DeFiAgent", "AgentConfig", "DEFI_AGENT_SYSTEM_PROMPT"]),
+    ("l0_orchestrator", ["L0OrchestratorAgent", "OrchestratorConfig", "L0_ORCHESTRATOR_SYSTEM_PROMPT"]),
+    ("architect_prime", ["ArchitectPrimeAgent", "ArchitectConfig"]),
+    ("qin_systems_engineer", ["QINSystemsEngineerAgent", "QINConfig"]),
 ]
+
+# Exported name -> (module, attribute). Submodules that are not present are
+# skipped via find_spec, which locates them without executing any code.
+_LAZY = {
+    name: (f"{__name__}.{module}", name)
+    for module, names in _CANDIDATES
+    if importlib.util.find_spec(f"{__name__}.{module}") is not None
+    for name in names
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(spec[0]), spec[1])
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -24,11 +24,14 @@ Core Mandate:
 """
 
 import os
+import re
+import sys
 import json
 from typing import List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+from bisect import bisect_right
 
 
 # ---------------------------------------------------------------------------
@@ -59,7 +62,19 @@ class PQCScheme(Enum):
     SPHINCS_PLUS = "SPHINCS+"                  # Digital signatures (hash-based)
 
 
-@dataclass
+# Cache each member's value as a plain instance attribute so the logging
+# paths read ``member._v`` instead of going through the ``Enum.value``
+# descriptor on every access.
+for _enum in (TechPillar, MathFoundation, PQCScheme):
+    for _m in _enum:
+        _m._v = _m.value
+del _enum, _m
+
+# Horizontal rule used by the banner output
+_RULE = "=" * 70
+
+
+@dataclass(slots=True)
 class ArchitectConfig:
     """Configuration parameters for the Architect Prime agent."""
 
@@ -100,7 +115,7 @@ class ArchitectConfig:
 # Data Models (Blueprints)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Blueprint:
     """Base class for an architectural blueprint."""
     blueprint_id: str
@@ -113,7 +128,14 @@ class Blueprint:
     pseudoscience_check_passed: bool = False
 
 
-@dataclass
+def _bump_version(version: str, tenths: int) -> str:
+    """Advance a "major.minor" version by ``tenths`` minor steps in integer math."""
+    major, _, minor = version.partition(".")
+    total = int(major) * 10 + int(minor[:1] or 0) + tenths
+    return f"{total // 10}.{total % 10}"
+
+
+@dataclass(slots=True)
 class ModularBlockchainBlueprint(Blueprint):
     """Blueprint for the sovereign modular blockchain stack."""
     pillar: TechPillar = TechPillar.MODULAR_BLOCKCHAIN
@@ -130,7 +152,7 @@ class ModularBlockchainBlueprint(Blueprint):
     })
 
 
-@dataclass
+@dataclass(slots=True)
 class ZkEvmBlueprint(Blueprint):
     """Blueprint for the privacy-preserving layer."""
     pillar: TechPillar = TechPillar.ZK_EVM
@@ -144,7 +166,7 @@ class ZkEvmBlueprint(Blueprint):
     ])
 
 
-@dataclass
+@dataclass(slots=True)
 class QuantumAiBlueprint(Blueprint):
     """Blueprint for the intelligence and value layer."""
     pillar: TechPillar = TechPillar.QUANTUM_RESILIENT_AI
@@ -171,6 +193,25 @@ class QuantumAiBlueprint(Blueprint):
     ])
 
 
+# Blueprint shape per pillar: (pillar, blueprint class, blueprint id, math basis).
+# CAD builds from this table instead of re-running the per-class list factories.
+_PILLAR_TEMPLATES = (
+    (TechPillar.MODULAR_BLOCKCHAIN, ModularBlockchainBlueprint, "MB-002", (
+        MathFoundation.ABSTRACT_ALGEBRA,
+        MathFoundation.NUMBER_THEORY,
+    )),
+    (TechPillar.ZK_EVM, ZkEvmBlueprint, "ZK-002", (
+        MathFoundation.ABSTRACT_ALGEBRA,
+        MathFoundation.NUMBER_THEORY,
+    )),
+    (TechPillar.QUANTUM_RESILIENT_AI, QuantumAiBlueprint, "QA-002", (
+        MathFoundation.ABSTRACT_ALGEBRA,
+        MathFoundation.NUMBER_THEORY,
+        MathFoundation.QUANTUM_PHYSICS,
+        MathFoundation.COMPUTATIONAL_COMPLEXITY,
+    )),
+)
+
 # ---------------------------------------------------------------------------
 # Pseudoscience Validation Engine
 # ---------------------------------------------------------------------------
@@ -182,19 +223,22 @@ class ScientificValidator:
     Explicitly rejects pseudoscientific or unverified systems.
     """
 
-    REJECTED_FRAMEWORKS = [
+    REJECTED_FRAMEWORKS = tuple(sys.intern(name) for name in (
         "terryology",
         "numerology",
         "astrology",
         "sacred geometry (unverified claims)",
         "perpetual motion",
         "free energy",
-    ]
+    ))
+
+    # Single-pass matcher over all rejected frameworks, built once at class load.
+    _REJECT_RE = re.compile("|".join(map(re.escape, REJECTED_FRAMEWORKS)), re.IGNORECASE)
 
-    REQUIRED_FOUNDATIONS = [
+    REQUIRED_FOUNDATIONS = frozenset({
         MathFoundation.ABSTRACT_ALGEBRA,
         MathFoundation.NUMBER_THEORY,
-    ]
+    })
 
     @classmethod
     def validate_blueprint(cls, blueprint: Blueprint) -> Tuple[bool, str]:
@@ -202,22 +246,44 @@ class ScientificValidator:
         if not blueprint.math_basis:
             return False, "Blueprint lacks mathematical foundation specification."
 
-        for required in cls.REQUIRED_FOUNDATIONS:
-            if required not in blueprint.math_basis:
-                return False, f"Blueprint missing required foundation: {required.value}"
+        # Built per call so later edits to math_basis are always seen
+        missing = cls.REQUIRED_FOUNDATIONS.difference(blueprint.math_basis)
+        if missing:
+            names = ", ".join(sorted(m._v for m in missing))
+            return False, f"Blueprint missing required foundation: {names}"
 
-        blueprint.pseudoscience_check_passed = True
+        if not blueprint.pseudoscience_check_passed:
+            blueprint.pseudoscience_check_passed = True
         return True, "Blueprint passes scientific rigor validation."
 
     @classmethod
     def reject_if_pseudoscience(cls, concept: str) -> Tuple[bool, str]:
         """Check if a concept is based on rejected pseudoscientific frameworks."""
-        concept_lower = concept.lower()
-        for rejected in cls.REJECTED_FRAMEWORKS:
-            if rejected in concept_lower:
-                return True, f"REJECTED: '{concept}' is based on pseudoscientific framework '{rejected}'."
+        match = cls._REJECT_RE.search(concept)
+        if match:
+            rejected = match.group(0).lower()
+            return True, f"REJECTED: '{concept}' is based on pseudoscientific framework '{rejected}'."
         return False, f"ACCEPTED: '{concept}' is not flagged as pseudoscience."
 
+    @classmethod
+    def batch_reject(cls, concepts: List[str]) -> List[bool]:
+        """
+        Screen many concepts at once; returns a rejection mask aligned with
+        ``concepts``. The concepts are joined into one buffer and scanned in a
+        single regex pass, with match offsets mapped back to their concept.
+        """
+        starts = []
+        offset = 0
+        for concept in concepts:
+            starts.append(offset)
+            offset += len(concept) + 1  # +1 for the "\n" separator
+
+        mask = [False] * len(concepts)
+        # No rejected term contains a newline, so a match never spans two concepts
+        for match in cls._REJECT_RE.finditer("\n".join(concepts)):
+            mask[bisect_right(starts, match.start()) - 1] = True
+        return mask
+
 
 # ---------------------------------------------------------------------------
 # Core Agent — CSNA 2.0 Logic Engine Integration
@@ -246,6 +312,8 @@ class ArchitectPrimeAgent:
         self.config = config or ArchitectConfig()
         self.validator = ScientificValidator()
         self.blueprints: Dict[TechPillar, Blueprint] = {}
+        # Same blueprints in TechPillar order, for hash-free iteration
+        self.blueprints_by_index: Tuple[Blueprint, ...] = ()
         self.is_operational = False
         self.design_phase = 0
 
@@ -259,12 +327,16 @@ class ArchitectPrimeAgent:
         RAG → CAD → ToT → Validate → RSIP
         """
         self.design_phase += 1
-        print(f"\n" + "=" * 70)
-        print(f"  Architect Prime v2.0 — Design Phase {self.design_phase}")
-        print(f"  Objective: Engineer Digital Monopoly by {self.config.target_year}")
-        print(f"  Foundations: Abstract Algebra | Number Theory | Quantum Physics")
-        print(f"  PQC: {self.config.pqc_key_encapsulation.value} + {self.config.pqc_digital_signature.value}")
-        print(f"" + "=" * 70 + "\n")
+        print("\n".join((
+            "",
+            _RULE,
+            f"  Architect Prime v2.0 — Design Phase {self.design_phase}",
+            f"  Objective: Engineer Digital Monopoly by {self.config.target_year}",
+            "  Foundations: Abstract Algebra | Number Theory | Quantum Physics",
+            f"  PQC: {self.config.pqc_key_encapsulation._v} + {self.config.pqc_digital_signature._v}",
+            _RULE,
+            "",
+        )))
 
         # 1. RAG: Analyze technology landscape (peer-reviewed sources)
         tech_landscape = self._rag_analyze_landscape()
@@ -281,15 +353,20 @@ class ArchitectPrimeAgent:
         # 5. RSIP: Refine blueprints based on simulated performance
         refined_blueprints = self._rsip_refine_blueprints(validated_blueprints)
 
-        self.blueprints = refined_blueprints
-
-        print(f"\n" + "=" * 70)
-        print(f"  Design Phase {self.design_phase} Complete — Blueprints Generated")
-        print(f"" + "=" * 70 + "\n")
-
-        for pillar, bp in self.blueprints.items():
+        self.blueprints_by_index = refined_blueprints
+        self.blueprints = {bp.pillar: bp for bp in refined_blueprints}
+
+        lines = [
+            "",
+            _RULE,
+            f"  Design Phase {self.design_phase} Complete — Blueprints Generated",
+            _RULE,
+            "",
+        ]
+        for bp in self.blueprints_by_index:
             sci_status = "VERIFIED" if bp.pseudoscience_check_passed else "UNVERIFIED"
-            print(f"  [{sci_status}] {pillar.value}: v{bp.version} — {bp.status}")
+            lines.append(f"  [{sci_status}] {bp.pillar._v}: v{bp.version} — {bp.status}")
+        print("\n".join(lines))
 
         return self.blueprints
 
@@ -334,29 +411,24 @@ class ArchitectPrimeAgent:
     # CAD Module — Blueprint Decomposition
     # -------------------------------------------------------------------
 
-    def _cad_decompose_into_blueprints(self, tech_landscape: Dict) -> Dict:
+    def _cad_decompose_into_blueprints(self, tech_landscape: Dict) -> Tuple[Blueprint, ...]:
         """CAD: Decompose high-level objectives into detailed blueprints."""
         print("[CAD] Decomposing objectives into architectural blueprints...")
         print("      Grounding in Abstract Algebra and Number Theory...")
 
-        return {
-            TechPillar.MODULAR_BLOCKCHAIN: ModularBlockchainBlueprint(
-                blueprint_id="MB-002",
-                math_basis=[MathFoundation.ABSTRACT_ALGEBRA, MathFoundation.NUMBER_THEORY],
-            ),
-            TechPillar.ZK_EVM: ZkEvmBlueprint(
-                blueprint_id="ZK-002",
-            ),
-            TechPillar.QUANTUM_RESILIENT_AI: QuantumAiBlueprint(
-                blueprint_id="QA-002",
-            ),
-        }
+        # One timestamp per design phase rather than one utcnow() per blueprint
+        ts = datetime.utcnow()
+
+        return tuple(
+            blueprint_cls(blueprint_id=blueprint_id, timestamp=ts, math_basis=list(math_basis))
+            for _pillar, blueprint_cls, blueprint_id, math_basis in _PILLAR_TEMPLATES
+        )
 
     # -------------------------------------------------------------------
     # ToT Module — Architectural Pathway Evaluation
     # -------------------------------------------------------------------
 
-    def _tot_evaluate_pathways(self, blueprints: Dict) -> Dict:
+    def _tot_evaluate_pathways(self, blueprints: Tuple[Blueprint, ...]) -> Tuple[Blueprint, ...]:
         """
         ToT: Explore and validate different architectural choices.
         Reject any pathway relying on unverified assumptions.
@@ -364,7 +436,7 @@ class ArchitectPrimeAgent:
         print("[ToT] Evaluating architectural pathways...")
         print("      Rejecting any pathway based on pseudoscientific assumptions...")
 
-        for pillar, bp in blueprints.items():
+        for bp in blueprints:
             # Simulate pathway evaluation
             bp.status = "Evaluated"
 
@@ -374,16 +446,17 @@ class ArchitectPrimeAgent:
     # Scientific Validation
     # -------------------------------------------------------------------
 
-    def _validate_scientific_rigor(self, blueprints: Dict) -> Dict:
+    def _validate_scientific_rigor(self, blueprints: Tuple[Blueprint, ...]) -> Tuple[Blueprint, ...]:
         """Validate all blueprints against scientific rigor standards."""
         print("[VALIDATE] Running scientific rigor checks...")
 
-        for pillar, bp in blueprints.items():
-            is_valid, message = self.validator.validate_blueprint(bp)
+        validate = self.validator.validate_blueprint  # bind once, outside the loop
+        for bp in blueprints:
+            is_valid, message = validate(bp)
             if is_valid:
-                print(f"  PASS: {pillar.value} — {message}")
+                print(f"  PASS: {bp.pillar._v} — {message}")
             else:
-                print(f"  FAIL: {pillar.value} — {message}")
+                print(f"  FAIL: {bp.pillar._v} — {message}")
                 bp.status = "REJECTED — Failed scientific validation"
 
         return blueprints
@@ -392,14 +465,14 @@ class ArchitectPrimeAgent:
     # RSIP Module — Recursive Blueprint Refinement
     # -------------------------------------------------------------------
 
-    def _rsip_refine_blueprints(self, blueprints: Dict) -> Dict:
+    def _rsip_refine_blueprints(self, blueprints: Tuple[Blueprint, ...]) -> Tuple[Blueprint, ...]:
         """RSIP: Refine blueprints through formal verification and stress tests."""
         print("[RSIP] Refining blueprints with formal verification...")
 
-        for bp in blueprints.values():
+        for bp in blueprints:
             if bp.pseudoscience_check_passed:
                 bp.status = "Refined & Verified"
-                bp.version = f"{float(bp.version) + self.design_phase * 0.1:.1f}"
+                bp.version = _bump_version(bp.version, self.design_phase)
 
         return blueprints
 
@@ -410,31 +483,38 @@ class ArchitectPrimeAgent:
 
 def demo():
     """Demonstrate the Architect Prime v2.0 agent."""
-    print("\n" + "=" * 70)
-    print("  Celestial Quantum Ascendancy")
-    print("  Architect Prime v2.0 — Scientifically Grounded Architecture")
-    print("  Built by Marcus Pollard — US Navy Veteran")
-    print("=" * 70)
+    print("\n".join((
+        "",
+        _RULE,
+        "  Celestial Quantum Ascendancy",
+        "  Architect Prime v2.0 — Scientifically Grounded Architecture",
+        "  Built by Marcus Pollard — US Navy Veteran",
+        _RULE,
+    )))
 
     config = ArchitectConfig()
     agent = ArchitectPrimeAgent(config=config)
     agent.is_operational = True
 
-    print(f"\nAgent initialized. Objective: Digital Monopoly by {config.target_year}.")
-    print(f"Clientele: {', '.join(config.primary_clientele)}")
-    print(f"PQC KEM: {config.pqc_key_encapsulation.value}")
-    print(f"PQC Sig: {config.pqc_digital_signature.value}")
-    print(f"ZK System: {config.zk_proof_system}")
-    print(f"DA Layer: {config.data_availability_layer}")
-    print(f"Pseudoscience Rejection: {'ENABLED' if config.reject_pseudoscience else 'DISABLED'}")
-    print(f"Formal Verification: {'REQUIRED' if config.require_formal_verification else 'OPTIONAL'}")
+    print("\n".join((
+        "",
+        f"Agent initialized. Objective: Digital Monopoly by {config.target_year}.",
+        f"Clientele: {', '.join(config.primary_clientele)}",
+        f"PQC KEM: {config.pqc_key_encapsulation._v}",
+        f"PQC Sig: {config.pqc_digital_signature._v}",
+        f"ZK System: {config.zk_proof_system}",
+        f"DA Layer: {config.data_availability_layer}",
+        f"Pseudoscience Rejection: {'ENABLED' if config.reject_pseudoscience else 'DISABLED'}",
+        f"Formal Verification: {'REQUIRED' if config.require_formal_verification else 'OPTIONAL'}",
+    )))
 
     # Scientific validation demo
-    print("\n--- Scientific Validation Demo ---")
+    lines = ["", "--- Scientific Validation Demo ---"]
     validator = ScientificValidator()
     for concept in ["Lattice-based cryptography", "Terryology", "Elliptic curve groups"]:
         is_rejected, msg = validator.reject_if_pseudoscience(concept)
-        print(f"  {msg}")
+        lines.append(f"  {msg}")
+    print("\n".join(lines))
 
     # Execute one demonstration design phase
     blueprints = agent.execute_design_phase()
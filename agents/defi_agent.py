@@ -15,13 +15,23 @@ Strategies:
 """
 
 import os
+import sys
+import asyncio
 import json
 import time
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
-from enum import Enum
+import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from typing import List, Dict, Optional, Tuple, Deque, Iterator, FrozenSet
+from dataclasses import dataclass, field, replace
+from enum import Enum, IntEnum
 from datetime import datetime
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # Configuration & Constants
@@ -36,7 +46,22 @@ class RiskLevel(Enum):
     CRITICAL = 9
 
 
-@dataclass
+class StrategyType(IntEnum):
+    """Strategy family of an active position."""
+    YIELD_FARMING = 0
+    ARBITRAGE = 1
+    LIQUIDITY_PROVISION = 2
+
+
+class TaskType(IntEnum):
+    """CAD sub-task kinds dispatched by ToT and execution."""
+    YIELD_REBALANCE = 0
+    ARBITRAGE_EXECUTION = 1
+    TRIANGULAR_ARBITRAGE = 2
+    RISK_ASSESSMENT = 3
+
+
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration parameters for the DeFi agent."""
 
@@ -56,30 +81,75 @@ class AgentConfig:
     # Gas fee thresholds (Gwei)
     max_gas_l1_gwei: float = 40.0
     max_gas_l2_gwei: float = 4.0
+    gas_cache_ttl_s: float = 1.0  # reuse a gas reading for this long
+
+    # Branch execution concurrency (exchange/RPC calls are I/O-bound)
+    max_execution_workers: int = 8
 
     # Supported networks
-    supported_networks: List[str] = field(default_factory=lambda: [
+    supported_networks: Tuple[str, ...] = (
         "ethereum", "arbitrum", "optimism", "polygon", "base"
-    ])
+    )
 
     # Monitored protocols
-    monitored_protocols: List[str] = field(default_factory=lambda: [
+    monitored_protocols: Tuple[str, ...] = (
         "aave", "compound", "uniswap_v3", "curve", "yearn",
         "lido", "rocket_pool", "pendle", "balancer", "gmx"
-    ])
+    )
 
     # Monitored exchanges (CEX + DEX)
-    monitored_exchanges: List[str] = field(default_factory=lambda: [
+    monitored_exchanges: Tuple[str, ...] = (
         "uniswap", "sushiswap", "curve", "balancer", "1inch",
         "binance", "coinbase", "kraken", "okx", "bybit"
-    ])
+    )
+
+    # History retention (oldest entries are dropped beyond these)
+    max_transaction_log: int = 100_000
+    max_performance_history: int = 10_000
+    max_rag_history: int = 64
+
+    # Membership views of the lists above, built in __post_init__
+    _networks_set: FrozenSet[str] = field(init=False, repr=False)
+    _protocols_set: FrozenSet[str] = field(init=False, repr=False)
+    _exchanges_set: FrozenSet[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Accept any iterable from callers but store immutable tuples
+        self.supported_networks = tuple(self.supported_networks)
+        self.monitored_protocols = tuple(self.monitored_protocols)
+        self.monitored_exchanges = tuple(self.monitored_exchanges)
+        self._networks_set = frozenset(self.supported_networks)
+        self._protocols_set = frozenset(self.monitored_protocols)
+        self._exchanges_set = frozenset(self.monitored_exchanges)
+
+
+# Shared "now" at 10 ms granularity: [(time bucket, datetime)]
+_now_cache: List[Tuple[int, Optional[datetime]]] = [(0, None)]
+
+
+def _cached_utcnow() -> datetime:
+    """
+    ``datetime.utcnow()`` memoized per 10 ms bucket, so records created in
+    the same scan share one datetime instead of allocating one each.
+    """
+    bucket = time.time_ns() // 10_000_000
+    if _now_cache[0][0] != bucket:
+        _now_cache[0] = (bucket, datetime.utcnow())
+    return _now_cache[0][1]
+
+
+def _json_default(obj):
+    """JSON fallback encoder for transaction log records."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class YieldOpportunity:
     """Represents a yield farming opportunity."""
     protocol: str
@@ -91,10 +161,15 @@ class YieldOpportunity:
     security_score: float
     impermanent_loss_risk: float
     token_pair: Tuple[str, str]
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_cached_utcnow)
+
+    def __post_init__(self):
+        # Venue names repeat across thousands of records; share one copy
+        self.protocol = sys.intern(self.protocol)
+        self.network = sys.intern(self.network)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """Represents a cross-exchange or cross-chain arbitrage opportunity."""
     asset: str
@@ -109,14 +184,23 @@ class ArbitrageOpportunity:
     is_cross_chain: bool
     source_chain: Optional[str] = None
     dest_chain: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_cached_utcnow)
 
+    def __post_init__(self):
+        self.buy_exchange = sys.intern(self.buy_exchange)
+        self.sell_exchange = sys.intern(self.sell_exchange)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Position:
-    """Represents an active DeFi position."""
+    """
+    Represents an active DeFi position.
+
+    Frozen so the agent's SoA mirrors cannot drift; change a tracked position
+    through ``DeFiAgent._update_position``.
+    """
     position_id: str
-    strategy_type: str  # "yield_farming", "arbitrage", "liquidity_provision"
+    strategy_type: StrategyType
     protocol: str
     network: str
     entry_amount_usdc: float
@@ -127,8 +211,12 @@ class Position:
     entry_timestamp: datetime
     last_updated: datetime
 
+    def __post_init__(self):
+        object.__setattr__(self, "protocol", sys.intern(self.protocol))
+        object.__setattr__(self, "network", sys.intern(self.network))
 
-@dataclass
+
+@dataclass(slots=True)
 class PerformanceReport:
     """Daily performance summary."""
     date: str
@@ -144,6 +232,154 @@ class PerformanceReport:
     transactions_executed: int
 
 
+# ---------------------------------------------------------------------------
+# Vectorized Qualification Kernels
+# ---------------------------------------------------------------------------
+
+def _yield_columns(opportunities: List[YieldOpportunity]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract (apy, risk_score, security_score, tvl) columns from yield opportunities.
+
+    Every column stays float64: a narrower dtype rounds values across the
+    risk and TVL thresholds and disagrees with ``_calculate_confidence``.
+    """
+    n = len(opportunities)
+    apy = np.fromiter((o.apy for o in opportunities), dtype=np.float64, count=n)
+    risk = np.fromiter((o.risk_score for o in opportunities), dtype=np.float64, count=n)
+    sec = np.fromiter((o.security_score for o in opportunities), dtype=np.float64, count=n)
+    tvl = np.fromiter((o.tvl for o in opportunities), dtype=np.float64, count=n)
+    return apy, risk, sec, tvl
+
+
+def _arbitrage_column(opportunities: List[ArbitrageOpportunity]) -> np.ndarray:
+    """Extract the net_profit_pct column from arbitrage opportunities."""
+    return np.fromiter((o.net_profit_pct for o in opportunities), dtype=np.float64,
+                       count=len(opportunities))
+
+
+def _qualify_yield(apy: np.ndarray, risk: np.ndarray, sec: np.ndarray,
+                   min_apy: float, max_risk: float, min_sec: float) -> np.ndarray:
+    """Boolean mask of yield opportunities that clear all three thresholds."""
+    return (apy >= min_apy) & (risk <= max_risk) & (sec >= min_sec)
+
+
+def _qualify_arbitrage(net_profit: np.ndarray, min_profit: float) -> np.ndarray:
+    """Boolean mask of arbitrage opportunities that clear the profit threshold."""
+    return net_profit >= min_profit
+
+
+def _yield_confidence(sec: np.ndarray, tvl: np.ndarray) -> np.ndarray:
+    """Column form of ``DeFiAgent._calculate_confidence``."""
+    base = 0.5 + (sec - 5.0) * 0.05 + np.where(tvl > 10_000_000, 0.1, 0.0)
+    return np.clip(base, 0.0, 1.0)
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the ``k`` largest scores, highest first, in O(N).
+
+    Uses ``np.partition`` to find the k-th largest value instead of a full
+    sort; ties keep their original order, matching a stable descending sort.
+    """
+    n = scores.shape[0]
+    if n <= k:
+        return np.argsort(-scores, kind="stable")
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - above.size]
+    idx = np.sort(np.concatenate((above, ties)))
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def _build_arb_graph(opportunities: List[ArbitrageOpportunity]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Tuple[str, str]]]:
+    """
+    Build a directed (exchange, asset) graph from arbitrage opportunities.
+
+    Each opportunity becomes one edge (buy_exchange, asset) ->
+    (sell_exchange, asset) weighted by ``-log(sell/buy * (1 - fees))``, so a
+    cycle whose weights sum below zero compounds to a net profit. Keying
+    vertices by asset means a cycle can never chain legs of different
+    assets. Edge i corresponds to opportunity i; same-venue legs get an
+    infinite weight so they never form a self-loop cycle.
+    Returns (edge_src, edge_dst, edge_weight, vertex -> (exchange, asset)).
+    """
+    vertex_ids: Dict[Tuple[str, str], int] = {}
+    for o in opportunities:
+        vertex_ids.setdefault((o.buy_exchange, o.asset), len(vertex_ids))
+        vertex_ids.setdefault((o.sell_exchange, o.asset), len(vertex_ids))
+
+    n = len(opportunities)
+    src = np.fromiter((vertex_ids[o.buy_exchange, o.asset] for o in opportunities), dtype=np.int32, count=n)
+    dst = np.fromiter((vertex_ids[o.sell_exchange, o.asset] for o in opportunities), dtype=np.int32, count=n)
+    ratio = np.fromiter(
+        ((o.sell_price / o.buy_price if o.buy_price > 0 else 0.0) * (1 - o.estimated_fees_pct / 100)
+         for o in opportunities),
+        dtype=np.float64, count=n,
+    )
+    # Non-positive rates and same-venue legs can never be part of a profitable cycle
+    weight = np.full(n, np.inf)
+    valid = (ratio > 0) & (src != dst)
+    weight[valid] = -np.log(ratio[valid])
+    return src, dst, weight, list(vertex_ids)
+
+
+def _bellman_ford_neg_cycles(src: np.ndarray, dst: np.ndarray, weight: np.ndarray,
+                             n_vertices: int) -> List[List[int]]:
+    """
+    Detect negative cycles with one vectorized Bellman-Ford run, O(V·E).
+
+    Every vertex starts at distance 0 (an implicit source linked to all of
+    them), so cycles anywhere in the graph are found. Each pass relaxes all
+    edges at once with NumPy; an edge that still relaxes after V passes lies
+    on or leads to a negative cycle, which is recovered by walking the
+    predecessor edges. Returns each distinct cycle as a list of edge indices.
+    """
+    dist = np.zeros(n_vertices)
+    pred = np.full(n_vertices, -1, dtype=np.int64)
+    improving = np.empty(0, dtype=np.int64)
+
+    for _ in range(n_vertices):
+        cand = dist[src] + weight
+        improving = np.flatnonzero(cand < dist[dst] - 1e-12)
+        if improving.size == 0:
+            return []
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, dst[improving], cand[improving])
+        winners = improving[cand[improving] == new_dist[dst[improving]]]
+        pred[dst[winners]] = winners
+        dist = new_dist
+
+    cycles = []
+    seen = set()
+    for start in np.unique(dst[improving]):
+        # Step back V times so the walk is guaranteed to sit inside the cycle
+        v = int(start)
+        for _ in range(n_vertices):
+            if pred[v] < 0:
+                break
+            v = int(src[pred[v]])
+        if pred[v] < 0:
+            continue
+
+        cycle = []
+        u = v
+        while True:
+            edge = int(pred[u])
+            cycle.append(edge)
+            u = int(src[edge])
+            if u == v or len(cycle) > n_vertices:
+                break
+        cycle.reverse()
+
+        key = frozenset(cycle)
+        if u != v or key in seen or weight[cycle].sum() >= 0:
+            continue
+        seen.add(key)
+        cycles.append(cycle)
+
+    return cycles
+
+
 # ---------------------------------------------------------------------------
 # Core Agent — CSNA 2.0 Logic Engine Integration
 # ---------------------------------------------------------------------------
@@ -161,19 +397,50 @@ class DeFiAgent:
 
     def __init__(self, config: Optional[AgentConfig] = None):
         self.config = config or AgentConfig()
-        self.positions: List[Position] = []
-        self.transaction_log: List[Dict] = []
-        self.performance_history: List[PerformanceReport] = []
+        # Private so the SoA mirrors below cannot drift; mutate only through
+        # _add_position / _remove_positions (read via the positions property)
+        self._positions: List[Position] = []
+        self._risk_arr = np.empty(0, dtype=np.float64)
+        self._value_arr = np.empty(0, dtype=np.float64)
+        self._pnl_arr = np.empty(0, dtype=np.float64)
+        # Set whenever positions change; lets _execute_decisions reuse a risk check
+        self._risk_dirty = True
+        self._risk_ok: Optional[bool] = None
+        # JSON-encoded records (bytes); decode with iter_transactions()
+        self.transaction_log: Deque[bytes] = deque(maxlen=self.config.max_transaction_log)
+        self.performance_history: Deque[PerformanceReport] = deque(maxlen=self.config.max_performance_history)
+        self._tx_count = 0  # lifetime total; the log itself is bounded
         self.portfolio_value = self.config.initial_capital_usdc
         self.is_operational = False
         self.cycle_count = 0
 
         # CSNA 2.0 module states
-        self._rag_knowledge_base: List[Dict] = []
+        # Per-scan summaries only; full opportunity lists go to the caller
+        self._rag_knowledge_base: Deque[Dict] = deque(maxlen=self.config.max_rag_history)
         self._cad_task_graph: Dict = {}
         self._tot_branch_scores: Dict = {}
         self._rsip_refinement_delta: float = 0.0
 
+        # (monotonic fetch time, gas conditions) — see _check_gas_conditions
+        self._gas_cache: Optional[Tuple[float, Dict]] = None
+        # Reused by every _execute_decisions pass; released by close()
+        self._exec_pool = ThreadPoolExecutor(max_workers=self.config.max_execution_workers,
+                                             thread_name_prefix="defi-exec")
+
+    def close(self):
+        """Shut down the branch execution pool; the agent cannot execute afterwards."""
+        self._exec_pool.shutdown(wait=True)
+
+    @property
+    def positions(self) -> Tuple[Position, ...]:
+        """Read-only snapshot of the open positions."""
+        return tuple(self._positions)
+
+    @property
+    def latest_scan(self) -> Optional[Dict]:
+        """Summary of the most recent RAG market scan, if any."""
+        return self._rag_knowledge_base[-1] if self._rag_knowledge_base else None
+
     # -------------------------------------------------------------------
     # RAG Module — Market Intelligence Retrieval
     # -------------------------------------------------------------------
@@ -185,22 +452,52 @@ class DeFiAgent:
         Performs semantic search across protocol data, price feeds, and
         on-chain analytics to build a verified market picture.
         """
-        print("[RAG] Scanning market intelligence sources...")
+        logger.info("[RAG] Scanning market intelligence sources...")
+
+        return self._assemble_market_state(
+            self._scan_yield_opportunities(),
+            self._scan_arbitrage_opportunities(),
+            self._check_gas_conditions(),
+        )
+
+    async def rag_scan_market_async(self) -> Dict[str, List]:
+        """
+        RAG scan with the three source groups fetched concurrently.
 
-        yield_opportunities = self._scan_yield_opportunities()
-        arbitrage_opportunities = self._scan_arbitrage_opportunities()
-        gas_conditions = self._check_gas_conditions()
+        The scanners are blocking RPC calls, so each runs on a worker thread;
+        cycle latency becomes the slowest source rather than their sum.
+        """
+        logger.info("[RAG] Scanning market intelligence sources...")
+
+        yield_opportunities, arbitrage_opportunities, gas_conditions = await asyncio.gather(
+            asyncio.to_thread(self._scan_yield_opportunities),
+            asyncio.to_thread(self._scan_arbitrage_opportunities),
+            asyncio.to_thread(self._check_gas_conditions),
+        )
+        return self._assemble_market_state(yield_opportunities, arbitrage_opportunities,
+                                           gas_conditions)
 
+    def _assemble_market_state(self, yield_opportunities: List[YieldOpportunity],
+                               arbitrage_opportunities: List[ArbitrageOpportunity],
+                               gas_conditions: Dict) -> Dict[str, List]:
+        """Build the market state from fresh scans and record its summary."""
         market_state = {
             "yield_opportunities": yield_opportunities,
             "arbitrage_opportunities": arbitrage_opportunities,
+            # Columnar views consumed by the vectorized CAD filters
+            "yield_metrics": _yield_columns(yield_opportunities),
+            "arbitrage_net_profit": _arbitrage_column(arbitrage_opportunities),
             "gas_conditions": gas_conditions,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _cached_utcnow().isoformat()
         }
 
-        self._rag_knowledge_base.append(market_state)
-        print(f"[RAG] Found {len(yield_opportunities)} yield opportunities, "
-              f"{len(arbitrage_opportunities)} arbitrage opportunities")
+        self._rag_knowledge_base.append({
+            "n_yield": len(yield_opportunities),
+            "n_arb": len(arbitrage_opportunities),
+            "timestamp": market_state["timestamp"],
+        })
+        logger.info("[RAG] Found %d yield opportunities, %d arbitrage opportunities",
+                    len(yield_opportunities), len(arbitrage_opportunities))
 
         return market_state
 
@@ -216,43 +513,63 @@ class DeFiAgent:
         sub-tasks with full dependency mapping. Each sub-task inherits
         parent context while maintaining isolation.
         """
-        print("[CAD] Decomposing strategy into sub-tasks...")
+        logger.info("[CAD] Decomposing strategy into sub-tasks...")
 
         tasks = []
 
         # Sub-task 1: Evaluate yield farming rebalancing
         yield_opps = market_state.get("yield_opportunities", [])
-        qualifying_yields = [
-            opp for opp in yield_opps
-            if opp.apy >= self.config.min_yield_farming_apy
-            and opp.risk_score <= self.config.max_portfolio_risk_score
-            and opp.security_score >= self.config.min_smart_contract_security_score
-        ]
+        yield_metrics = market_state.get("yield_metrics")
+        if yield_metrics is None:
+            yield_metrics = _yield_columns(yield_opps)
+        apy, risk, sec, tvl = yield_metrics
+        yield_mask = _qualify_yield(
+            apy, risk, sec,
+            self.config.min_yield_farming_apy,
+            self.config.max_portfolio_risk_score,
+            self.config.min_smart_contract_security_score,
+        )
+        yield_idx = np.flatnonzero(yield_mask)
+        qualifying_yields = [yield_opps[i] for i in yield_idx]
         if qualifying_yields:
             tasks.append({
-                "type": "yield_rebalance",
+                "type": TaskType.YIELD_REBALANCE,
                 "priority": 2,
                 "opportunities": qualifying_yields,
+                # (apy, security_score, tvl) of the survivors, so ToT scores
+                # them without touching the dataclasses again
+                "metrics": (apy[yield_idx], sec[yield_idx], tvl[yield_idx]),
                 "dependency": None
             })
 
         # Sub-task 2: Execute arbitrage trades
         arb_opps = market_state.get("arbitrage_opportunities", [])
-        qualifying_arbs = [
-            opp for opp in arb_opps
-            if opp.net_profit_pct >= self.config.min_arbitrage_profit_pct
-        ]
+        arb_profit = market_state.get("arbitrage_net_profit")
+        if arb_profit is None:
+            arb_profit = _arbitrage_column(arb_opps)
+        arb_mask = _qualify_arbitrage(arb_profit, self.config.min_arbitrage_profit_pct)
+        qualifying_arbs = [arb_opps[i] for i in np.flatnonzero(arb_mask)]
         if qualifying_arbs:
             tasks.append({
-                "type": "arbitrage_execution",
+                "type": TaskType.ARBITRAGE_EXECUTION,
                 "priority": 1,  # highest priority — time-sensitive
                 "opportunities": qualifying_arbs,
                 "dependency": None
             })
 
+        # Sub-task 2b: Multi-hop (triangular) arbitrage cycles
+        arb_cycles = self._find_arbitrage_cycles(arb_opps)
+        if arb_cycles:
+            tasks.append({
+                "type": TaskType.TRIANGULAR_ARBITRAGE,
+                "priority": 1,
+                "cycles": arb_cycles,
+                "dependency": None
+            })
+
         # Sub-task 3: Risk assessment and position management
         tasks.append({
-            "type": "risk_assessment",
+            "type": TaskType.RISK_ASSESSMENT,
             "priority": 0,  # always runs
             "positions": self.positions,
             "dependency": None
@@ -264,7 +581,7 @@ class DeFiAgent:
             "tasks": tasks
         }
 
-        print(f"[CAD] Decomposed into {len(tasks)} sub-tasks")
+        logger.info("[CAD] Decomposed into %d sub-tasks", len(tasks))
         return tasks
 
     # -------------------------------------------------------------------
@@ -279,58 +596,66 @@ class DeFiAgent:
         risk exposure, and resource efficiency. Applies adversarial
         validation before committing to the winning branch.
         """
-        print("[ToT] Exploring decision branches...")
+        logger.info("[ToT] Exploring decision branches...")
 
         branch_results = {}
 
         for task in tasks:
             task_type = task["type"]
-            branches = []
-
-            if task_type == "yield_rebalance":
-                for opp in task.get("opportunities", []):
-                    branch = {
-                        "action": f"Enter {opp.protocol}/{opp.pool_name}",
-                        "expected_return": opp.apy,
-                        "risk_score": opp.risk_score,
-                        "confidence": self._calculate_confidence(opp),
-                        "capital_required": self.portfolio_value * self.config.max_position_size_pct
-                    }
-                    branches.append(branch)
-
-            elif task_type == "arbitrage_execution":
-                for opp in task.get("opportunities", []):
-                    branch = {
-                        "action": f"Arb {opp.asset}: {opp.buy_exchange} → {opp.sell_exchange}",
-                        "expected_return": opp.net_profit_pct,
-                        "risk_score": 2.0 if not opp.is_cross_chain else 4.0,
-                        "confidence": 0.85 if opp.liquidity_depth > 100_000 else 0.60,
-                        "capital_required": min(opp.liquidity_depth * 0.1, self.portfolio_value * 0.1)
-                    }
-                    branches.append(branch)
-
-            elif task_type == "risk_assessment":
-                branch = {
-                    "action": "Portfolio risk rebalance",
-                    "expected_return": 0,
-                    "risk_score": 0,
-                    "confidence": 1.0,
-                    "capital_required": 0
-                }
-                branches.append(branch)
+
+            # Score every candidate as columns; only the winners become dicts
+            if task_type is TaskType.YIELD_REBALANCE:
+                items = task.get("opportunities", [])
+                metrics = task.get("metrics")
+                if metrics is None:
+                    apy, _, sec, tvl = _yield_columns(items)
+                else:
+                    apy, sec, tvl = metrics
+                expected = apy
+                confidence = _yield_confidence(sec, tvl)
+                build_branch = self._yield_branch
+
+            elif task_type is TaskType.ARBITRAGE_EXECUTION:
+                items = task.get("opportunities", [])
+                expected = _arbitrage_column(items)
+                liquidity = np.fromiter((o.liquidity_depth for o in items), dtype=np.float64, count=len(items))
+                confidence = np.where(liquidity > 100_000, 0.85, 0.60)
+                build_branch = self._arbitrage_branch
+
+            elif task_type is TaskType.TRIANGULAR_ARBITRAGE:
+                items = task.get("cycles", [])
+                expected = np.fromiter((c["net_profit_pct"] for c in items), dtype=np.float64, count=len(items))
+                liquidity = np.fromiter((min(leg.liquidity_depth for leg in c["legs"]) for c in items),
+                                        dtype=np.float64, count=len(items))
+                confidence = np.where(liquidity > 100_000, 0.85, 0.60)
+                build_branch = self._cycle_branch
+
+            elif task_type is TaskType.RISK_ASSESSMENT:
+                items = [None]
+                expected = np.zeros(1)
+                confidence = np.ones(1)
+                build_branch = self._risk_branch
+
+            else:
+                items = []
+                expected = confidence = np.empty(0)
+                build_branch = None
 
             # Adversarial validation: filter branches below confidence threshold
-            validated = [b for b in branches if b["confidence"] >= 0.6]
+            validated = np.flatnonzero(confidence >= 0.6)
+            top = validated[_top_k_indices(expected[validated], 3)]
             branch_results[task_type] = {
-                "total_explored": len(branches),
-                "validated": len(validated),
-                "selected": sorted(validated, key=lambda x: x["expected_return"], reverse=True)[:3]
+                "total_explored": len(items),
+                "validated": int(validated.size),
+                "selected": [build_branch(items[i], float(confidence[i])) for i in top]
             }
 
         self._tot_branch_scores = branch_results
-        total_explored = sum(v["total_explored"] for v in branch_results.values())
-        total_validated = sum(v["validated"] for v in branch_results.values())
-        print(f"[ToT] Explored {total_explored} branches, validated {total_validated}")
+        if logger.isEnabledFor(logging.INFO):
+            total_explored = sum(v["total_explored"] for v in branch_results.values())
+            total_validated = sum(v["validated"] for v in branch_results.values())
+            logger.info("[ToT] Explored %d branches, validated %d",
+                        total_explored, total_validated)
 
         return branch_results
 
@@ -347,7 +672,7 @@ class DeFiAgent:
         Returns the refinement delta (improvement percentage).
         """
         self.cycle_count += 1
-        print(f"[RSIP] Self-improvement cycle {self.cycle_count}...")
+        logger.info("[RSIP] Self-improvement cycle %d...", self.cycle_count)
 
         # Calculate performance delta from last cycle
         if len(self.performance_history) >= 2:
@@ -362,15 +687,17 @@ class DeFiAgent:
             # Tighten risk parameters if losing
             self.config.max_portfolio_risk_score = max(3.0, self.config.max_portfolio_risk_score - 0.5)
             self.config.min_arbitrage_profit_pct += 0.05
-            print(f"[RSIP] Tightened risk: max_risk={self.config.max_portfolio_risk_score}, "
-                  f"min_arb_profit={self.config.min_arbitrage_profit_pct}%")
+            logger.info("[RSIP] Tightened risk: max_risk=%s, min_arb_profit=%s%%",
+                        self.config.max_portfolio_risk_score,
+                        self.config.min_arbitrage_profit_pct)
         elif delta > 0.5:
             # Slightly loosen if performing well
             self.config.max_portfolio_risk_score = min(7.0, self.config.max_portfolio_risk_score + 0.2)
-            print(f"[RSIP] Loosened risk: max_risk={self.config.max_portfolio_risk_score}")
+            logger.info("[RSIP] Loosened risk: max_risk=%s",
+                        self.config.max_portfolio_risk_score)
 
         self._rsip_refinement_delta = delta
-        print(f"[RSIP] Cycle {self.cycle_count} complete — delta: {delta:+.2f}%")
+        logger.info("[RSIP] Cycle %d complete — delta: %+.2f%%", self.cycle_count, delta)
 
         return delta
 
@@ -382,15 +709,36 @@ class DeFiAgent:
         """
         Execute one full agent cycle using the CSNA 2.0 pipeline:
         RAG → CAD → ToT → Execute → RSIP
+
+        Runs entirely on the calling thread; use ``execute_cycle_async`` to
+        overlap the RAG scans from inside an event loop.
         """
-        print(f"\n{'='*60}")
-        print(f"  DeFi Agent — Execution Cycle {self.cycle_count + 1}")
-        print(f"  Portfolio: ${self.portfolio_value:,.2f} USDC")
-        print(f"{'='*60}\n")
+        self._log_cycle_start()
 
         # Phase 1: RAG — Market Intelligence
         market_state = self.rag_scan_market()
 
+        return self._run_pipeline(market_state)
+
+    async def execute_cycle_async(self) -> Dict:
+        """Coroutine form of ``execute_cycle``; the RAG scan runs concurrently."""
+        self._log_cycle_start()
+
+        # Phase 1: RAG — Market Intelligence
+        market_state = await self.rag_scan_market_async()
+
+        return self._run_pipeline(market_state)
+
+    def _log_cycle_start(self):
+        """Log the cycle banner; skipped entirely when INFO is disabled."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"\n{'='*60}\n"
+                        f"  DeFi Agent — Execution Cycle {self.cycle_count + 1}\n"
+                        f"  Portfolio: ${self.portfolio_value:,.2f} USDC\n"
+                        f"{'='*60}\n")
+
+    def _run_pipeline(self, market_state: Dict) -> Dict:
+        """CAD → ToT → Execute → RSIP over one RAG market snapshot."""
         # Phase 2: CAD — Strategy Decomposition
         tasks = self.cad_decompose_strategy(market_state)
 
@@ -407,11 +755,12 @@ class DeFiAgent:
         report = self._generate_report()
         self.performance_history.append(report)
 
-        print(f"\n{'='*60}")
-        print(f"  Cycle Complete — PnL: ${report.total_pnl_usdc:+,.2f} "
-              f"({report.total_pnl_pct:+.2f}%)")
-        print(f"  Risk Score: {report.portfolio_risk_score}/10")
-        print(f"{'='*60}\n")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"\n{'='*60}\n"
+                        f"  Cycle Complete — PnL: ${report.total_pnl_usdc:+,.2f} "
+                        f"({report.total_pnl_pct:+.2f}%)\n"
+                        f"  Risk Score: {report.portfolio_risk_score}/10\n"
+                        f"{'='*60}\n")
 
         return {
             "cycle": self.cycle_count,
@@ -431,9 +780,9 @@ class DeFiAgent:
         portfolio_risk = self._calculate_portfolio_risk()
 
         if portfolio_risk > self.config.max_portfolio_risk_score:
-            print(f"[RISK] Portfolio risk {portfolio_risk:.1f} exceeds "
-                  f"threshold {self.config.max_portfolio_risk_score}. "
-                  f"Initiating risk reduction...")
+            logger.info("[RISK] Portfolio risk %.1f exceeds threshold %s. "
+                        "Initiating risk reduction...",
+                        portfolio_risk, self.config.max_portfolio_risk_score)
             self._reduce_risk_exposure()
             return False
 
@@ -444,18 +793,19 @@ class DeFiAgent:
         Immediately pause all operations and isolate assets.
         Triggered by anomalies, security threats, or critical errors.
         """
-        print(f"\n{'!'*60}")
-        print(f"  EMERGENCY PAUSE — {reason}")
-        print(f"  Isolating assets and awaiting human intervention...")
-        print(f"{'!'*60}\n")
+        logger.warning(f"\n{'!'*60}\n"
+                       f"  EMERGENCY PAUSE — {reason}\n"
+                       f"  Isolating assets and awaiting human intervention...\n"
+                       f"{'!'*60}\n")
 
         self.is_operational = False
+        self._gas_cache = None  # force a fresh gas reading on resume
         self._log_transaction({
             "type": "emergency_pause",
             "reason": reason,
             "portfolio_value": self.portfolio_value,
-            "active_positions": len(self.positions),
-            "timestamp": datetime.utcnow().isoformat()
+            "active_positions": len(self._positions),
+            "timestamp": _cached_utcnow()
         })
 
     # -------------------------------------------------------------------
@@ -474,8 +824,46 @@ class DeFiAgent:
         # Placeholder for demonstration
         return []
 
+    def _find_arbitrage_cycles(self, opportunities: List[ArbitrageOpportunity]) -> List[Dict]:
+        """
+        Find profitable multi-hop arbitrage cycles across exchanges.
+
+        Runs Bellman-Ford negative-cycle detection over the (exchange, asset)
+        graph once, rather than rescanning pairs, and keeps single-asset
+        cycles whose compounded net profit clears ``min_arbitrage_profit_pct``.
+        """
+        if len(opportunities) < 2:
+            return []
+
+        src, dst, weight, vertices = _build_arb_graph(opportunities)
+        cycles = []
+        for edges in _bellman_ford_neg_cycles(src, dst, weight, len(vertices)):
+            net_profit_pct = float(np.expm1(-weight[edges].sum()) * 100)
+            if net_profit_pct >= self.config.min_arbitrage_profit_pct:
+                cycles.append({
+                    "asset": vertices[src[edges[0]]][1],
+                    "legs": [opportunities[i] for i in edges],
+                    "net_profit_pct": net_profit_pct,
+                })
+        return cycles
+
     def _check_gas_conditions(self) -> Dict:
-        """Check current gas prices across networks."""
+        """
+        Check current gas prices across networks.
+
+        Readings are cached for ``gas_cache_ttl_s`` seconds (monotonic clock)
+        so repeated checks within a cycle cost one RPC round-trip.
+        """
+        now = time.monotonic()
+        if self._gas_cache is not None and now - self._gas_cache[0] < self.config.gas_cache_ttl_s:
+            return self._gas_cache[1]
+        gas = self._fetch_gas_conditions()
+        self._gas_cache = (now, gas)
+        return gas
+
+    def _fetch_gas_conditions(self) -> Dict:
+        """Fetch current gas prices across networks."""
+        # In production, this queries each network's RPC endpoint
         return {
             "ethereum": {"gwei": 0.0, "status": "unknown"},
             "arbitrum": {"gwei": 0.0, "status": "unknown"},
@@ -483,72 +871,206 @@ class DeFiAgent:
             "polygon": {"gwei": 0.0, "status": "unknown"},
         }
 
-    def _calculate_confidence(self, opportunity) -> float:
+    def _yield_branch(self, opp: YieldOpportunity, confidence: float) -> Dict:
+        """ToT branch payload for entering a yield farming position."""
+        return {
+            "action": f"Enter {opp.protocol}/{opp.pool_name}",
+            "expected_return": opp.apy,
+            "risk_score": opp.risk_score,
+            "confidence": confidence,
+            "capital_required": self.portfolio_value * self.config.max_position_size_pct
+        }
+
+    def _arbitrage_branch(self, opp: ArbitrageOpportunity, confidence: float) -> Dict:
+        """ToT branch payload for a two-venue arbitrage trade."""
+        return {
+            "action": f"Arb {opp.asset}: {opp.buy_exchange} → {opp.sell_exchange}",
+            "expected_return": opp.net_profit_pct,
+            "risk_score": 2.0 if not opp.is_cross_chain else 4.0,
+            "confidence": confidence,
+            "capital_required": min(opp.liquidity_depth * 0.1, self.portfolio_value * 0.1)
+        }
+
+    def _cycle_branch(self, cycle: Dict, confidence: float) -> Dict:
+        """ToT branch payload for a multi-hop arbitrage cycle."""
+        legs = cycle["legs"]
+        min_liquidity = min(leg.liquidity_depth for leg in legs)
+        route = " → ".join([legs[0].buy_exchange] + [leg.sell_exchange for leg in legs])
+        return {
+            "action": f"Cycle arb {cycle['asset']}: {route}",
+            "expected_return": cycle["net_profit_pct"],
+            "risk_score": 4.0 if any(leg.is_cross_chain for leg in legs) else 2.0,
+            "confidence": confidence,
+            "capital_required": min(min_liquidity * 0.1, self.portfolio_value * 0.1)
+        }
+
+    def _risk_branch(self, _item, confidence: float) -> Dict:
+        """ToT branch payload for the always-on portfolio risk rebalance."""
+        return {
+            "action": "Portfolio risk rebalance",
+            "expected_return": 0,
+            "risk_score": 0,
+            "confidence": confidence,
+            "capital_required": 0
+        }
+
+    def _calculate_confidence(self, opportunity: YieldOpportunity) -> float:
         """Calculate confidence score for a yield opportunity."""
-        base = 0.5
-        if hasattr(opportunity, 'security_score'):
-            base += (opportunity.security_score - 5.0) * 0.05
-        if hasattr(opportunity, 'tvl') and opportunity.tvl > 10_000_000:
-            base += 0.1
-        return min(1.0, max(0.0, base))
+        base = (0.5 + (opportunity.security_score - 5.0) * 0.05
+                + (0.1 if opportunity.tvl > 10_000_000 else 0.0))
+        return 0.0 if base < 0.0 else (1.0 if base > 1.0 else base)
+
+    def _add_position(self, position: Position):
+        """Track a new position in both the position list and the SoA buffers."""
+        self._positions.append(position)
+        self._risk_arr = np.append(self._risk_arr, position.risk_score)
+        self._value_arr = np.append(self._value_arr, position.current_value_usdc)
+        self._pnl_arr = np.append(self._pnl_arr, position.pnl_usdc)
+        self._risk_dirty = True
+
+    def _update_position(self, position_id: str, **changes) -> Position:
+        """Replace a tracked position's fields and rewrite its SoA row."""
+        for i, current in enumerate(self._positions):
+            if current.position_id == position_id:
+                break
+        else:
+            raise KeyError(position_id)
+        position = self._positions[i] = replace(current, **changes)
+        self._risk_arr[i] = position.risk_score
+        self._value_arr[i] = position.current_value_usdc
+        self._pnl_arr[i] = position.pnl_usdc
+        self._risk_dirty = True
+        return position
+
+    def _remove_positions(self, indices: np.ndarray):
+        """Drop the positions at ``indices`` from the list and the SoA buffers."""
+        keep = np.setdiff1d(np.arange(len(self._positions)), indices)
+        self._positions[:] = [self._positions[i] for i in keep]
+        self._risk_arr = self._risk_arr[keep]
+        self._value_arr = self._value_arr[keep]
+        self._pnl_arr = self._pnl_arr[keep]
+        self._risk_dirty = True
 
     def _calculate_portfolio_risk(self) -> float:
         """Calculate aggregate portfolio risk score."""
-        if not self.positions:
+        if not self._positions or self.portfolio_value <= 0:
             return 0.0
-        total_risk = sum(p.risk_score * (p.current_value_usdc / self.portfolio_value)
-                         for p in self.positions if self.portfolio_value > 0)
-        return total_risk
+        return float(np.dot(self._risk_arr, self._value_arr) / self.portfolio_value)
 
     def _reduce_risk_exposure(self):
-        """Reduce portfolio risk by exiting highest-risk positions."""
-        sorted_positions = sorted(self.positions, key=lambda p: p.risk_score, reverse=True)
-        for pos in sorted_positions:
-            if self._calculate_portfolio_risk() <= self.config.max_portfolio_risk_score:
-                break
-            print(f"[RISK] Exiting position: {pos.position_id} (risk: {pos.risk_score})")
-            self.positions.remove(pos)
-            self.portfolio_value += pos.current_value_usdc
+        """
+        Reduce portfolio risk by exiting highest-risk positions.
 
-    def _execute_decisions(self, decisions: Dict) -> Dict:
-        """Execute the selected decision branches."""
-        results = {"executed": 0, "skipped": 0, "errors": 0}
+        Computes the portfolio risk after exiting the k riskiest positions for
+        every k in one prefix-sum pass, then exits the smallest such prefix
+        that brings risk within threshold.
+        """
+        if not self._positions or self.portfolio_value <= 0:
+            return
+
+        order = np.argsort(-self._risk_arr, kind="stable")
+        weighted = (self._risk_arr * self._value_arr)[order]
+        # Exited value returns to the portfolio, so the denominator grows with k
+        remaining = weighted.sum() - np.concatenate(([0.0], np.cumsum(weighted)))
+        value_after = self.portfolio_value + np.concatenate(([0.0], np.cumsum(self._value_arr[order])))
+        risk_after = remaining / value_after
+        risk_after[-1] = 0.0  # every position exited
+
+        k = int(np.argmax(risk_after <= self.config.max_portfolio_risk_score))
+        if k == 0:
+            return
+
+        exits = order[:k]
+        if logger.isEnabledFor(logging.INFO):
+            for i in exits:
+                pos = self._positions[i]
+                logger.info("[RISK] Exiting position: %s (risk: %s)",
+                            pos.position_id, pos.risk_score)
+        self.portfolio_value += float(self._value_arr[exits].sum())
+        self._remove_positions(exits)
 
-        for task_type, branch_data in decisions.items():
-            for branch in branch_data.get("selected", []):
-                # Gas check before execution
-                gas = self._check_gas_conditions()
-                eth_gas = gas.get("ethereum", {}).get("gwei", 0)
+    def _execute_decisions(self, decisions: Dict) -> Dict:
+        """
+        Execute the selected decision branches.
 
-                if eth_gas > self.config.max_gas_l1_gwei and eth_gas > 0:
-                    print(f"[GAS] Deferring {branch['action']} — gas too high ({eth_gas} Gwei)")
+        Gas and risk gating run on the calling thread in selection order,
+        since a failed risk check exits positions and so decides which later
+        branches are skipped. CAD sub-tasks carry no dependencies, so the
+        branches that clear the gates then run concurrently on the agent's
+        thread pool; transactions are logged afterwards in selection order.
+        """
+        results = {"executed": 0, "skipped": 0, "errors": 0}
+        branches = [(task_type, branch)
+                    for task_type, branch_data in decisions.items()
+                    for branch in branch_data.get("selected", [])]
+        if not branches:
+            return results
+
+        # Gas check once per execution pass, shared by every branch
+        gas = self._check_gas_conditions()
+        eth_gas = gas.get("ethereum", {}).get("gwei", 0)
+
+        # Risk is only re-scanned when positions changed since the last check
+        # (a failed check exits positions, so the next branch re-evaluates)
+        self._risk_ok = None
+
+        cleared = []
+        for task_type, branch in branches:
+            try:
+                if not self._branch_cleared(branch, eth_gas):
                     results["skipped"] += 1
                     continue
+            except Exception:
+                logger.exception("[EXEC] Branch %s failed", branch.get("action"))
+                results["errors"] += 1
+                continue
+            cleared.append((branch, self._exec_pool.submit(self._execute_one_branch, task_type, branch)))
+
+        for branch, future in cleared:
+            try:
+                tx = future.result()
+            except Exception:
+                logger.exception("[EXEC] Branch %s failed", branch.get("action"))
+                results["errors"] += 1
+                continue
+            self._log_transaction(tx)
+            results["executed"] += 1
 
-                # Risk check before execution
-                if not self.check_risk_thresholds():
-                    print(f"[RISK] Skipping {branch['action']} — risk threshold exceeded")
-                    results["skipped"] += 1
-                    continue
+        return results
 
-                self._log_transaction({
-                    "type": task_type,
-                    "action": branch["action"],
-                    "expected_return": branch["expected_return"],
-                    "capital": branch["capital_required"],
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-                results["executed"] += 1
+    def _branch_cleared(self, branch: Dict, eth_gas: float) -> bool:
+        """Gas and risk gates for one ToT branch; False means skip it."""
+        if eth_gas > self.config.max_gas_l1_gwei and eth_gas > 0:
+            logger.info("[GAS] Deferring %s — gas too high (%s Gwei)",
+                        branch["action"], eth_gas)
+            return False
 
-        return results
+        # Risk check before execution
+        if self._risk_ok is None or self._risk_dirty:
+            self._risk_dirty = False
+            self._risk_ok = self.check_risk_thresholds()
+        if not self._risk_ok:
+            logger.info("[RISK] Skipping %s — risk threshold exceeded", branch["action"])
+            return False
+        return True
+
+    def _execute_one_branch(self, task_type: TaskType, branch: Dict) -> Dict:
+        """Run one cleared ToT branch; returns its transaction record."""
+        return {
+            "type": task_type.name.lower(),
+            "action": branch["action"],
+            "expected_return": branch["expected_return"],
+            "capital": branch["capital_required"],
+            "timestamp": _cached_utcnow()
+        }
 
     def _generate_report(self) -> PerformanceReport:
         """Generate a performance report for the current cycle."""
-        total_pnl = sum(p.pnl_usdc for p in self.positions)
+        total_pnl = float(self._pnl_arr.sum())
         total_pnl_pct = (total_pnl / self.config.initial_capital_usdc * 100) if self.config.initial_capital_usdc > 0 else 0
 
         return PerformanceReport(
-            date=datetime.utcnow().strftime("%Y-%m-%d"),
+            date=_cached_utcnow().strftime("%Y-%m-%d"),
             total_portfolio_value=self.portfolio_value,
             total_pnl_usdc=total_pnl,
             total_pnl_pct=total_pnl_pct,
@@ -556,14 +1078,26 @@ class DeFiAgent:
             arbitrage_pnl=0.0,
             lp_fees_pnl=0.0,
             gas_costs=0.0,
-            active_positions=len(self.positions),
+            active_positions=len(self._positions),
             portfolio_risk_score=self._calculate_portfolio_risk(),
-            transactions_executed=len(self.transaction_log)
+            transactions_executed=self._tx_count
         )
 
     def _log_transaction(self, tx: Dict):
-        """Log a transaction to the immutable ledger."""
-        self.transaction_log.append(tx)
+        """
+        Log a transaction to the immutable ledger.
+
+        Records are serialized to compact JSON bytes on write, so the log holds
+        no live dict graphs for the GC to trace. datetimes encode as ISO 8601.
+        """
+        self.transaction_log.append(
+            json.dumps(tx, separators=(",", ":"), default=_json_default).encode()
+        )
+        self._tx_count += 1
+
+    def iter_transactions(self) -> Iterator[Dict]:
+        """Decode logged transactions, oldest first."""
+        return map(json.loads, self.transaction_log)
 
 
 # ---------------------------------------------------------------------------
@@ -632,8 +1166,22 @@ def demo():
     print(f"Networks: {', '.join(config.supported_networks)}")
     print(f"Protocols: {', '.join(config.monitored_protocols)}")
 
+    # Buffer the agent's log records and flush them once the cycle is done
+    handler = logging.handlers.MemoryHandler(
+        capacity=1000, target=logging.StreamHandler(sys.stdout)
+    )
+    logger.addHandler(handler)
+    previous_level = logger.level
+    logger.setLevel(logging.INFO)
+
     # Execute one demonstration cycle
-    result = agent.execute_cycle()
+    try:
+        result = agent.execute_cycle()
+    finally:
+        handler.flush()
+        logger.removeHandler(handler)
+        handler.close()
+        logger.setLevel(previous_level)
 
     print("\nAgent ready for production deployment.")
     print("Connect exchange APIs and on-chain data feeds to activate live trading.\n")
@@ -16,18 +16,33 @@ Strategies:
 """
 
 import os
+import sys
 import json
-from typing import List, Dict, Optional, Tuple
+import hashlib
+import logging
+import logging.handlers
+import contextvars
+import weakref
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple, Deque, Iterable, Iterator, NamedTuple, Mapping
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from datetime import datetime
+from heapq import nlargest
+from operator import attrgetter, itemgetter
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
 # Configuration & Constants
 # ---------------------------------------------------------------------------
 
-class ControlLevel(Enum):
+class ControlLevel(IntEnum):
     """Defines the level of control over a network or protocol."""
     MONITORING = 1
     INFLUENCE = 3
@@ -36,6 +51,30 @@ class ControlLevel(Enum):
     ABSOLUTE_CONTROL = 9
 
 
+_BANNER = "=" * 60
+
+# Packed per-chain control state mirrored from L0OrchestratorAgent.network_states
+_NETWORK_DTYPE = np.dtype([("control_level", "u1")])
+
+# Packed governance proposal columns; status is encoded via _PROPOSAL_STATUS
+_PROPOSAL_DTYPE = np.dtype([("status", "u1"), ("impact", "f8")])
+_PROPOSAL_STATUS = {"active": 1, "passed": 2, "failed": 3}
+
+# CAD control tasks: (task type, priority, EcosystemState getter for its data,
+# getter for its packed columns or None)
+_CAD_TASKS = (
+    # Optimize revenue streams
+    ("revenue_optimization", 2, attrgetter("revenue_streams"), None),
+    # Enhance network control
+    ("network_control_enhancement", 1, attrgetter("network_states"), None),
+    # Execute governance strategy
+    ("governance_execution", 0, attrgetter("governance_proposals"), attrgetter("governance_columns")),
+)
+
+# ToT ranking key for control pathways
+_CONTROL_IMPACT = itemgetter("control_impact")
+
+
 @dataclass
 class OrchestratorConfig:
     """Configuration parameters for the L0 Orchestrator agent."""
@@ -53,6 +92,9 @@ class OrchestratorConfig:
     max_data_access_fee_usdc: float = 1000.0
     min_liquidity_provision_apr: float = 15.0
 
+    # ToT pathways whose accumulated RSIP penalty exceeds this are skipped
+    branch_penalty_threshold: float = 2.0
+
     # Monitored assets & chains
     strategic_assets: List[str] = field(default_factory=lambda: [
         "BTC", "ETH", "USDC", "USDT", "CQA_TOKEN"
@@ -61,14 +103,36 @@ class OrchestratorConfig:
         "CQA_Treasury", "Partner_A_Corp", "Partner_B_Gov"
     ])
 
+    # History retention (oldest entries are dropped beyond this)
+    max_rag_history: int = 64
+    rag_cache_size: int = 32  # ecosystem snapshots kept by chain-head fingerprint
+
+
+# Clock shared by everything created during one execute_cycle (None between
+# cycles). Context-local, so agents cycling on different threads never see
+# each other's clock; the RAG scan workers run in a copy of the cycle context.
+_CYCLE_NOW: "contextvars.ContextVar[Optional[datetime]]" = contextvars.ContextVar(
+    "l0_cycle_now", default=None
+)
+
+
+def _cycle_now() -> datetime:
+    """The current cycle's timestamp, or ``datetime.utcnow()`` outside a cycle."""
+    return _CYCLE_NOW.get() or datetime.utcnow()
+
 
 # ---------------------------------------------------------------------------
 # Data Models
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NetworkState:
-    """Represents the state of a monitored blockchain network."""
+    """
+    Represents the state of a monitored blockchain network.
+
+    Frozen so the agent's packed mirror cannot drift; record a new state
+    through ``L0OrchestratorAgent._set_network_state``.
+    """
     chain_id: str
     network_type: str  # "L1", "L2", "Consortium"
     validator_count: int
@@ -78,20 +142,20 @@ class NetworkState:
     governance_token_supply: float
     controlled_governance_tokens: float
     control_level: ControlLevel
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_cycle_now)
 
 
-@dataclass
+@dataclass(slots=True)
 class RevenueStream:
     """Represents a single revenue stream within the ecosystem."""
     stream_id: str
     source: str  # e.g., "CrossChainFees", "ValidatorRewards", "DataAccess"
     amount_usdc: float
     frequency: str  # "daily", "weekly", "monthly"
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_cycle_now)
 
 
-@dataclass
+@dataclass(slots=True)
 class GovernanceProposal:
     """Represents an active governance proposal."""
     proposal_id: str
@@ -104,6 +168,28 @@ class GovernanceProposal:
     strategic_impact_score: float = 0.0  # 1-10 scale
 
 
+class EcosystemState(NamedTuple):
+    """One RAG snapshot of the ecosystem, as consumed by CAD."""
+    network_states: List[NetworkState]
+    revenue_streams: List[RevenueStream]
+    governance_proposals: List[GovernanceProposal]
+    timestamp: str
+    governance_columns: Optional[np.ndarray] = None  # see _proposal_columns
+
+
+def _branch_signature(task_type: str, action: str) -> bytes:
+    """Stable 16-byte key for a ToT pathway, used by the RSIP blacklist."""
+    return hashlib.blake2b(f"{task_type}\0{action}".encode(), digest_size=16).digest()
+
+
+def _proposal_columns(proposals: List[GovernanceProposal]) -> np.ndarray:
+    """Pack proposals' (status, strategic_impact_score) into a structured array."""
+    arr = np.empty(len(proposals), dtype=_PROPOSAL_DTYPE)
+    arr["status"] = [_PROPOSAL_STATUS.get(p.status, 0) for p in proposals]
+    arr["impact"] = [p.strategic_impact_score for p in proposals]
+    return arr
+
+
 # ---------------------------------------------------------------------------
 # Core Agent — CSNA 2.0 Logic Engine Integration
 # ---------------------------------------------------------------------------
@@ -120,45 +206,92 @@ class L0OrchestratorAgent:
         - RSIP: Recursive Self-Improving Prompts for policy refinement
     """
 
-    def __init__(self, config: Optional[OrchestratorConfig] = None):
+    def __init__(self, config: Optional[OrchestratorConfig] = None, verbose: bool = False):
         self.config = config or OrchestratorConfig()
-        self.network_states: Dict[str, NetworkState] = {}
+        self.verbose = verbose  # log the per-cycle banners
+        # Private so the packed mirror below cannot drift; update only through
+        # _set_network_state (read via the network_states property)
+        self._network_states: Dict[str, NetworkState] = {}
+        # Row i of _network_arr describes chain _network_ids[i]
+        self._network_ids: List[str] = []
+        self._network_rows: Dict[str, int] = {}
+        self._network_arr = np.empty(0, dtype=_NETWORK_DTYPE)
+        # Bumped on every network_states change; keys the control-level cache
+        self._states_version = 0
+        self._cached_level_version = -1
+        self._cached_level = 0.0
         self.revenue_streams: List[RevenueStream] = []
         self.governance_proposals: List[GovernanceProposal] = []
         self.is_operational = False
         self.cycle_count = 0
 
         # CSNA 2.0 module states
-        self._rag_knowledge_base: List[Dict] = []
+        self._rag_knowledge_base: Deque[Dict] = deque(maxlen=self.config.max_rag_history)
+        # fingerprint -> ecosystem snapshot, least recently used first
+        self._rag_cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        # The three RAG scans are independent RPC-bound calls; overlap them
+        self._scan_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="rag-scan")
         self._cad_task_graph: Dict = {}
         self._tot_branch_scores: Dict = {}
         self._rsip_refinement_delta: float = 0.0
+        # (task type, action) signature -> accumulated underperformance penalty
+        self._branch_blacklist: Dict[bytes, float] = {}
+
+    def close(self):
+        """Shut down the RAG scan pool; the agent cannot scan afterwards."""
+        self._scan_pool.shutdown(wait=True)
+
+    @property
+    def network_states(self) -> Mapping[str, NetworkState]:
+        """Read-only view of the tracked chains, keyed by chain_id."""
+        return MappingProxyType(self._network_states)
 
     # -------------------------------------------------------------------
     # RAG Module — Ecosystem Intelligence Retrieval
     # -------------------------------------------------------------------
 
-    def rag_scan_ecosystem(self) -> Dict[str, List]:
+    def rag_scan_ecosystem(self) -> EcosystemState:
         """
         RAG: Retrieve and ground ecosystem intelligence from on-chain data,
         validator nodes, and governance forums.
         """
-        print("[RAG] Scanning ecosystem intelligence sources...")
-
-        network_states = self._scan_network_states()
-        revenue_streams = self._scan_revenue_streams()
-        governance_proposals = self._scan_governance_proposals()
-
-        ecosystem_state = {
-            "network_states": network_states,
-            "revenue_streams": revenue_streams,
-            "governance_proposals": governance_proposals,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        logger.info("[RAG] Scanning ecosystem intelligence sources...")
+
+        # Unchanged chain heads mean unchanged upstream state: reuse the snapshot.
+        # With no heads known there is nothing to compare, so always rescan.
+        fingerprint = self._ecosystem_fingerprint()
+        cached = self._rag_cache.get(fingerprint) if fingerprint is not None else None
+        if cached is not None:
+            self._rag_cache.move_to_end(fingerprint)
+            ecosystem_state = cached._replace(timestamp=_cycle_now().isoformat())
+            logger.info("[RAG] Chain heads unchanged, reusing cached snapshot")
+        else:
+            # One context copy per task: a Context cannot be entered by two threads
+            futures = tuple(
+                self._scan_pool.submit(contextvars.copy_context().run, scan)
+                for scan in (self._scan_network_states, self._scan_revenue_streams,
+                             self._scan_governance_proposals)
+            )
+            network_states, revenue_streams, governance_proposals = (f.result() for f in futures)
+            for state in network_states:
+                self._set_network_state(state)
+            ecosystem_state = EcosystemState(
+                network_states=network_states,
+                revenue_streams=revenue_streams,
+                governance_proposals=governance_proposals,
+                timestamp=_cycle_now().isoformat(),
+                # Packed once per snapshot, so cache hits reuse it as well
+                governance_columns=_proposal_columns(governance_proposals),
+            )
+            if fingerprint is not None:
+                self._rag_cache[fingerprint] = ecosystem_state
+                if len(self._rag_cache) > self.config.rag_cache_size:
+                    self._rag_cache.popitem(last=False)
 
         self._rag_knowledge_base.append(ecosystem_state)
-        print(f"[RAG] Scanned {len(network_states)} networks, {len(revenue_streams)} revenue streams, "
-              f"and {len(governance_proposals)} governance proposals")
+        logger.info("[RAG] Scanned %d networks, %d revenue streams, and %d governance proposals",
+                    len(ecosystem_state.network_states), len(ecosystem_state.revenue_streams),
+                    len(ecosystem_state.governance_proposals))
 
         return ecosystem_state
 
@@ -166,56 +299,58 @@ class L0OrchestratorAgent:
     # CAD Module — Strategic Decomposition
     # -------------------------------------------------------------------
 
-    def cad_decompose_strategy(self, ecosystem_state: Dict) -> List[Dict]:
+    def cad_decompose_strategy(self, ecosystem_state: EcosystemState) -> List[Dict]:
         """
         CAD: Decompose complex ecosystem state into actionable control tasks.
         """
-        print("[CAD] Decomposing strategy into control tasks...")
-
-        tasks = []
-
-        # Task 1: Optimize revenue streams
-        tasks.append({
-            "type": "revenue_optimization",
-            "priority": 2,
-            "data": ecosystem_state.get("revenue_streams", []),
-            "dependency": None
-        })
-
-        # Task 2: Enhance network control
-        tasks.append({
-            "type": "network_control_enhancement",
-            "priority": 1,
-            "data": ecosystem_state.get("network_states", []),
-            "dependency": None
-        })
-
-        # Task 3: Execute governance strategy
-        tasks.append({
-            "type": "governance_execution",
-            "priority": 0,
-            "data": ecosystem_state.get("governance_proposals", []),
-            "dependency": None
-        })
+        return list(self.cad_decompose_strategy_iter(ecosystem_state))
+
+    def cad_decompose_strategy_iter(self, ecosystem_state: EcosystemState) -> Iterator[Dict]:
+        """
+        Streaming form of ``cad_decompose_strategy``: yields each control task
+        as it is built so ToT can consume it without an intermediate list.
+
+        Logging and the task graph are set up eagerly, before ToT starts
+        pulling tasks; ``_cad_task_graph["tasks"]`` fills in as they are yielded.
+        """
+        logger.info("[CAD] Decomposing strategy into control tasks...")
 
+        recorded: List[Dict] = []
         self._cad_task_graph = {
-            "total_tasks": len(tasks),
+            "total_tasks": len(_CAD_TASKS),
             "decomposition_depth": 3,
-            "tasks": tasks
+            "tasks": recorded,
         }
 
-        print(f"[CAD] Decomposed into {len(tasks)} control tasks")
-        return tasks
+        logger.info("[CAD] Decomposed into %d control tasks", len(_CAD_TASKS))
+        return self._cad_task_stream(ecosystem_state, recorded)
+
+    def _cad_task_stream(self, ecosystem_state: EcosystemState,
+                         recorded: List[Dict]) -> Iterator[Dict]:
+        """Build the ``_CAD_TASKS`` entries lazily, recording each one it yields."""
+        for task_type, priority, get_data, get_columns in _CAD_TASKS:
+            task = {
+                "type": task_type,
+                "priority": priority,
+                "data": get_data(ecosystem_state),
+                "dependency": None
+            }
+            # Columnar view of the data, when RAG packed one
+            columns = get_columns(ecosystem_state) if get_columns is not None else None
+            if columns is not None:
+                task["columns"] = columns
+            recorded.append(task)
+            yield task
 
     # -------------------------------------------------------------------
     # ToT Module — Multi-Branch Control Pathway Exploration
     # -------------------------------------------------------------------
 
-    def tot_evaluate_branches(self, tasks: List[Dict]) -> Dict:
+    def tot_evaluate_branches(self, tasks: Iterable[Dict]) -> Dict:
         """
         ToT: Explore multiple control pathways simultaneously.
         """
-        print("[ToT] Exploring control pathways...")
+        logger.info("[ToT] Exploring control pathways...")
 
         branch_results = {}
 
@@ -238,36 +373,53 @@ class L0OrchestratorAgent:
                 })
 
             elif task_type == "network_control_enhancement":
-                for chain_id, state in self.network_states.items():
-                    if state.control_level.value < ControlLevel.DOMINANCE.value:
-                        branches.append({
-                            "action": f"Acquire 5% more stake in {chain_id}",
-                            "expected_revenue_gain": 0,
-                            "control_impact": 0.8,
-                            "confidence": 0.8
-                        })
+                below = np.flatnonzero(
+                    self._network_arr["control_level"] < ControlLevel.DOMINANCE
+                )
+                for i in below:
+                    branches.append({
+                        "action": f"Acquire 5% more stake in {self._network_ids[i]}",
+                        "expected_revenue_gain": 0,
+                        "control_impact": 0.8,
+                        "confidence": 0.8
+                    })
 
             elif task_type == "governance_execution":
-                for prop in task.get("data", []):
-                    if prop.status == "active":
-                        branches.append({
-                            "action": f"Vote FOR on proposal {prop.proposal_id}",
-                            "expected_revenue_gain": 0,
-                            "control_impact": prop.strategic_impact_score / 10,
-                            "confidence": 0.95
-                        })
+                proposals = task.get("data", [])
+                columns = task.get("columns")
+                if columns is None:
+                    columns = _proposal_columns(proposals)
+                active = np.flatnonzero(columns["status"] == _PROPOSAL_STATUS["active"])
+                impacts = (columns["impact"][active] / 10).tolist()
+                branches.extend({
+                    "action": f"Vote FOR on proposal {proposals[i].proposal_id}",
+                    "expected_revenue_gain": 0,
+                    "control_impact": impact,
+                    "confidence": 0.95
+                } for i, impact in zip(active, impacts))
+
+            # Drop pathways RSIP has repeatedly seen underperform
+            if self._branch_blacklist:
+                threshold = self.config.branch_penalty_threshold
+                branches = [
+                    b for b in branches
+                    if self._branch_blacklist.get(_branch_signature(task_type, b["action"]), 0.0) <= threshold
+                ]
 
             validated = [b for b in branches if b["confidence"] >= 0.7]
             branch_results[task_type] = {
                 "total_explored": len(branches),
                 "validated": len(validated),
-                "selected": sorted(validated, key=lambda x: x["control_impact"], reverse=True)[:3]
+                # nlargest keeps sorted()'s tie order without sorting everything
+                "selected": nlargest(3, validated, key=_CONTROL_IMPACT)
             }
 
         self._tot_branch_scores = branch_results
-        total_explored = sum(v["total_explored"] for v in branch_results.values())
-        total_validated = sum(v["validated"] for v in branch_results.values())
-        print(f"[ToT] Explored {total_explored} pathways, validated {total_validated}")
+        if logger.isEnabledFor(logging.INFO):
+            total_explored = sum(v["total_explored"] for v in branch_results.values())
+            total_validated = sum(v["validated"] for v in branch_results.values())
+            logger.info("[ToT] Explored %d pathways, validated %d",
+                        total_explored, total_validated)
 
         return branch_results
 
@@ -279,14 +431,26 @@ class L0OrchestratorAgent:
         """
         RSIP: Feed performance metrics back into the control architecture.
         """
+        # Nothing was executed, skipped or errored: no signal to refine on
+        if not any(execution_results.values()):
+            return 0.0
+
         self.cycle_count += 1
-        print(f"[RSIP] Policy refinement cycle {self.cycle_count}...")
+        logger.info("[RSIP] Policy refinement cycle %d...", self.cycle_count)
+
+        # Penalize pathways whose realized revenue missed the estimate by >50%.
+        # Each outcome: {"task_type", "action", "expected_revenue_gain",
+        # "realized_revenue_gain"}
+        for outcome in execution_results.get("outcomes", ()):
+            if outcome["realized_revenue_gain"] < 0.5 * outcome["expected_revenue_gain"]:
+                sig = _branch_signature(outcome["task_type"], outcome["action"])
+                self._branch_blacklist[sig] = self._branch_blacklist.get(sig, 0.0) + 1.0
 
         # Placeholder for actual refinement logic
         delta = 0.1 * self.cycle_count
 
         self._rsip_refinement_delta = delta
-        print(f"[RSIP] Cycle {self.cycle_count} complete — delta: {delta:+.2f}%")
+        logger.info("[RSIP] Cycle %d complete — delta: %+.2f%%", self.cycle_count, delta)
 
         return delta
 
@@ -299,20 +463,31 @@ class L0OrchestratorAgent:
         Execute one full agent cycle using the CSNA 2.0 pipeline:
         RAG → CAD → ToT → Execute → RSIP
         """
-        print(f"\n" + "="*60)
-        print(f"  L0 Orchestrator — Execution Cycle {self.cycle_count + 1}")
-        print(f"  Ecosystem Control Level: {self._get_ecosystem_control_level():.1f}/10")
-        print(f"" + "="*60 + "\n")
-
-        ecosystem_state = self.rag_scan_ecosystem()
-        tasks = self.cad_decompose_strategy(ecosystem_state)
-        decisions = self.tot_evaluate_branches(tasks)
-        execution_results = self._execute_decisions(decisions)
-        refinement_delta = self.rsip_refine(execution_results)
-
-        print(f"\n" + "="*60)
-        print(f"  Cycle Complete — Control Delta: {refinement_delta:+.2f}%")
-        print(f"" + "="*60 + "\n")
+        if not self.is_operational:
+            logger.debug("Agent not operational; skipping cycle")
+            return {"cycle": self.cycle_count, "refinement_delta": 0.0}
+
+        if self.verbose and logger.isEnabledFor(logging.INFO):
+            logger.info("\n%s\n  L0 Orchestrator — Execution Cycle %d\n"
+                        "  Ecosystem Control Level: %.1f/10\n%s\n",
+                        _BANNER, self.cycle_count + 1,
+                        self._get_ecosystem_control_level(), _BANNER)
+
+        clock = _CYCLE_NOW.set(datetime.utcnow())
+        try:
+            ecosystem_state = self.rag_scan_ecosystem()
+            # CAD streams tasks straight into ToT; no task list is materialized
+            decisions = self.tot_evaluate_branches(
+                self.cad_decompose_strategy_iter(ecosystem_state)
+            )
+            execution_results = self._execute_decisions(decisions)
+            refinement_delta = self.rsip_refine(execution_results)
+        finally:
+            _CYCLE_NOW.reset(clock)
+
+        if self.verbose:
+            logger.info("\n%s\n  Cycle Complete — Control Delta: %+.2f%%\n%s\n",
+                        _BANNER, refinement_delta, _BANNER)
 
         return {
             "cycle": self.cycle_count,
@@ -323,6 +498,36 @@ class L0OrchestratorAgent:
     # Internal Methods
     # -------------------------------------------------------------------
 
+    def _ecosystem_fingerprint(self) -> Optional[bytes]:
+        """
+        Content hash of the latest block height on every connected chain, or
+        None when no chain heads are available.
+        """
+        heads = self._fetch_chain_heads()
+        if not heads:
+            return None
+        h = hashlib.blake2b(digest_size=16)
+        for chain_id, height in sorted(heads.items()):
+            h.update(f"{chain_id}:{height};".encode())
+        return h.digest()
+
+    def _fetch_chain_heads(self) -> Dict[str, int]:
+        # Placeholder — latest block height per chain, from each chain's RPC
+        return {}
+
+    def _set_network_state(self, state: NetworkState):
+        """Record a chain's state in both network_states and the packed mirror."""
+        row = (int(state.control_level),)
+        i = self._network_rows.get(state.chain_id)
+        if i is not None:
+            self._network_arr[i] = row
+        else:
+            self._network_rows[state.chain_id] = len(self._network_ids)
+            self._network_ids.append(state.chain_id)
+            self._network_arr = np.append(self._network_arr, np.array([row], dtype=_NETWORK_DTYPE))
+        self._network_states[state.chain_id] = state
+        self._states_version += 1
+
     def _scan_network_states(self) -> List[NetworkState]:
         # Placeholder
         return []
@@ -336,10 +541,43 @@ class L0OrchestratorAgent:
         return []
 
     def _execute_decisions(self, decisions: Dict) -> Dict:
-        # Placeholder
-        return {"executed": 0, "skipped": 0, "errors": 0}
+        """
+        Execute the selected ToT branches and report a per-branch outcome for
+        each one that ran, which RSIP scores against its estimate.
+        """
+        results = {"executed": 0, "skipped": 0, "errors": 0, "outcomes": []}
+        for task_type, branch_data in decisions.items():
+            for branch in branch_data.get("selected", ()):
+                try:
+                    realized = self._execute_branch(task_type, branch)
+                except Exception:
+                    logger.exception("[EXEC] Branch %s failed", branch["action"])
+                    results["errors"] += 1
+                    continue
+                if realized is None:
+                    continue  # no executor connected for this pathway
+                results["executed"] += 1
+                results["outcomes"].append({
+                    "task_type": task_type,
+                    "action": branch["action"],
+                    "expected_revenue_gain": branch["expected_revenue_gain"],
+                    "realized_revenue_gain": realized,
+                })
+        return results
+
+    def _execute_branch(self, task_type: str, branch: Dict) -> Optional[float]:
+        """Carry out one branch; returns its realized revenue gain, or None if not run."""
+        # Placeholder — in production, this submits the on-chain / governance action
+        return None
 
     def _get_ecosystem_control_level(self) -> float:
+        """Ecosystem control level, recomputed only after network_states changes."""
+        if self._cached_level_version != self._states_version:
+            self._cached_level = self._compute_ecosystem_control_level()
+            self._cached_level_version = self._states_version
+        return self._cached_level
+
+    def _compute_ecosystem_control_level(self) -> float:
         # Placeholder
         return 0.0
 
@@ -382,6 +620,28 @@ Execution Protocol:
 Initiation Command:
 Begin by conducting a comprehensive real-time ecosystem scan to identify the top 3 opportunities for increasing control and the top 3 for maximizing revenue."""
 
+# The prompt is sent on every LLM call: share one interned copy and its UTF-8 form
+L0_ORCHESTRATOR_SYSTEM_PROMPT = sys.intern(L0_ORCHESTRATOR_SYSTEM_PROMPT)
+_PROMPT_UTF8 = L0_ORCHESTRATOR_SYSTEM_PROMPT.encode("utf-8")
+
+# tokenizer -> token ids; entries go away with their tokenizer
+_PROMPT_TOKENS_CACHE: "weakref.WeakKeyDictionary[object, Tuple[int, ...]]" = weakref.WeakKeyDictionary()
+
+
+def get_prompt_token_ids(tokenizer) -> Tuple[int, ...]:
+    """
+    Token ids of the system prompt for ``tokenizer`` (anything with an
+    ``encode(str)`` method), computed once per tokenizer. Tokenizers that
+    cannot be weakly referenced are encoded on every call.
+    """
+    try:
+        ids = _PROMPT_TOKENS_CACHE.get(tokenizer)
+    except TypeError:
+        return tuple(tokenizer.encode(L0_ORCHESTRATOR_SYSTEM_PROMPT))
+    if ids is None:
+        ids = _PROMPT_TOKENS_CACHE[tokenizer] = tuple(tokenizer.encode(L0_ORCHESTRATOR_SYSTEM_PROMPT))
+    return ids
+
 
 # ---------------------------------------------------------------------------
 # Demo / Entry Point
@@ -389,14 +649,14 @@ Begin by conducting a comprehensive real-time ecosystem scan to identify the top
 
 def demo():
     """Demonstrate the L0 Orchestrator agent initialization and cycle execution."""
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print("  Celestial Quantum Ascendancy")
     print("  L0 Orchestrator Agent — CSNA 2.0 Logic Engine")
     print("  Built by Marcus Pollard — US Navy Veteran")
-    print("=" * 60)
+    print(_BANNER)
 
     config = OrchestratorConfig()
-    agent = L0OrchestratorAgent(config=config)
+    agent = L0OrchestratorAgent(config=config, verbose=True)
     agent.is_operational = True
 
     print(f"\nAgent initialized for Layer 0: {config.layer_0_protocol}")
@@ -404,8 +664,22 @@ def demo():
     print(f"Target Validator Control: {config.min_validator_control_pct * 100}%")
     print(f"Target Governance Power: {config.target_governance_voting_power_pct * 100}%")
 
+    # Buffer the agent's log records and flush them once the cycle is done
+    handler = logging.handlers.MemoryHandler(
+        capacity=1000, target=logging.StreamHandler(sys.stdout)
+    )
+    logger.addHandler(handler)
+    previous_level = logger.level
+    logger.setLevel(logging.INFO)
+
     # Execute one demonstration cycle
-    result = agent.execute_cycle()
+    try:
+        result = agent.execute_cycle()
+    finally:
+        handler.flush()
+        logger.removeHandler(handler)
+        handler.close()
+        logger.setLevel(previous_level)
 
     print("\nAgent ready for production deployment.")
     print("Connect to Layer 0 nodes, consortium chain APIs, and governance forums to activate live orchestration.\n")
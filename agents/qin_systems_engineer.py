@@ -16,7 +16,8 @@ Core Architecture:
 """
 
 import os
-from typing import List, Dict, Optional, Any
+from typing import List, Optional, Any, Tuple, Mapping
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -33,6 +34,10 @@ class QINLayer(Enum):
     ASSET = "Asset Layer: Modular Blockchain & RWA Tokenization"
 
 
+# Web nomenclature rejected outright (matched case-insensitively, whole term)
+_OBSOLETE_SET = frozenset({"web3", "web5", "web8"})
+
+
 @dataclass
 class QINConfig:
     """Configuration parameters for the QIN Systems Engineer."""
@@ -46,91 +51,100 @@ class QINConfig:
 # Data Models (Deployment Blueprint Phases)
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BlueprintPhase:
     """Base class for a QIN deployment blueprint phase."""
     phase_number: int
     title: str
     layer: QINLayer
-    core_technologies: List[str]
-    mathematical_basis: List[str]
-    deployment_steps: Dict[str, str] = field(default_factory=dict)
+    core_technologies: Tuple[str, ...]
+    mathematical_basis: Tuple[str, ...]
+    deployment_steps: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InfrastructurePhase(BlueprintPhase):
     """Phase 1: Quantum Internet Foundation."""
     phase_number: int = 1
     title: str = "Quantum Internet Foundation"
     layer: QINLayer = QINLayer.INFRASTRUCTURE
-    core_technologies: List[str] = field(default_factory=lambda: [
+    core_technologies: Tuple[str, ...] = (
         "Quantum Entanglement Distribution Network",
         "Photonic Routing Fabric",
         "Quantum Repeaters",
         "Atomic Clocks for Synchronization"
-    ])
-    mathematical_basis: List[str] = field(default_factory=lambda: [
+    )
+    mathematical_basis: Tuple[str, ...] = (
         "Quantum Information Theory",
         "Bell's Theorem",
         "Linear Algebra (Hilbert Spaces)"
-    ])
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CryptographicPhase(BlueprintPhase):
     """Phase 2: Quantum Key Distribution (QKD)."""
     phase_number: int = 2
     title: str = "Quantum Key Distribution (QKD)"
     layer: QINLayer = QINLayer.CRYPTOGRAPHIC
-    core_technologies: List[str] = field(default_factory=lambda: [
+    core_technologies: Tuple[str, ...] = (
         "Quantum Key Distribution (QKD) Protocol (e.g., BB84)",
         "Heisenberg's Uncertainty Principle for Interception Detection",
         "Single-Photon Detectors",
         "Post-Quantum Cryptography (PQC) for initial authentication"
-    ])
-    mathematical_basis: List[str] = field(default_factory=lambda: [
+    )
+    mathematical_basis: Tuple[str, ...] = (
         "Heisenberg's Uncertainty Principle",
         "No-Cloning Theorem",
         "Information Theory"
-    ])
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SecurityPhase(BlueprintPhase):
     """Phase 3: Polymorphic AI Security (CARTA)."""
     phase_number: int = 3
     title: str = "Polymorphic AI Security"
     layer: QINLayer = QINLayer.SECURITY
-    core_technologies: List[str] = field(default_factory=lambda: [
+    core_technologies: Tuple[str, ...] = (
         "Continuous Adaptive Risk and Trust Assessment (CARTA)",
         "Polymorphic Encryption & Network Pathways",
         "AI-driven Anomaly Detection",
         "Real-time Threat Surface Elimination"
-    ])
-    mathematical_basis: List[str] = field(default_factory=lambda: [
+    )
+    mathematical_basis: Tuple[str, ...] = (
         "Game Theory",
         "Control Theory",
         "Bayesian Inference"
-    ])
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AssetPhase(BlueprintPhase):
     """Phase 4: Modular Blockchain & RWA Tokenization."""
     phase_number: int = 4
     title: str = "Modular Blockchain & RWA Tokenization"
     layer: QINLayer = QINLayer.ASSET
-    core_technologies: List[str] = field(default_factory=lambda: [
+    core_technologies: Tuple[str, ...] = (
         "Modular Blockchain Architecture (Execution/DA/Consensus separation)",
         "Consortium-style Smart Contract Module",
         "Real-World Asset (RWA) Tokenization Standard (e.g., ERC-3643)",
         "Zero-Knowledge Proofs for Asset Privacy"
-    ])
-    mathematical_basis: List[str] = field(default_factory=lambda: [
+    )
+    mathematical_basis: Tuple[str, ...] = (
         "Abstract Algebra (Finite Fields)",
         "Number Theory (Elliptic Curves)",
         "Merkle Trees"
-    ])
+    )
+
+
+# The phases are immutable configuration: build them once and share them
+_QIN_BLUEPRINT: Tuple[BlueprintPhase, ...] = (
+    InfrastructurePhase(),
+    CryptographicPhase(),
+    SecurityPhase(),
+    AssetPhase(),
+)
 
 
 # ---------------------------------------------------------------------------
@@ -148,8 +162,7 @@ class QINSystemsEngineerAgent:
 
     def reject_standard_nomenclature(self, term: str) -> str:
         """Rejects obsolete web terms and initiates QIN blueprint translation."""
-        obsolete_terms = ["web3", "web5", "web8"]
-        if any(term.lower() in t for t in obsolete_terms):
+        if term.lower() in _OBSOLETE_SET:
             return (f"REJECTED: Term \"{term}\" is obsolete or fictional. Translating request into a "
                     f"Quantum Information Network (QIN) blueprint based on verifiable physics.")
         return f"ACCEPTED: Term \"{term}\" is valid. Proceeding with standard architecture."
@@ -157,12 +170,7 @@ class QINSystemsEngineerAgent:
     def generate_qin_blueprint(self) -> List[BlueprintPhase]:
         """Generates the full 4-phase modular deployment blueprint for the QIN."""
         print("Generating 4-Phase Quantum Information Network (QIN) Blueprint...")
-        blueprint = [
-            InfrastructurePhase(),
-            CryptographicPhase(),
-            SecurityPhase(),
-            AssetPhase(),
-        ]
+        blueprint = list(_QIN_BLUEPRINT)
         print("Blueprint generation complete.")
         return blueprint
 
@@ -4,7 +4,11 @@ Built by Marcus Pollard - U.S. Navy Veteran
 """
 
 import os
-from typing import List, Dict
+import json
+import hashlib
+import functools
+from typing import List, Dict, Optional, Set
+import numpy as np
 from langchain.agents import AgentExecutor, create_react_agent
 from langchain.tools import Tool
 from langchain_openai import ChatOpenAI
@@ -18,52 +22,145 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=8)
+def _chat_llm(temperature: float = 0.7, model: str = "gpt-3.5-turbo") -> ChatOpenAI:
+    """Shared chat client per (temperature, model), so agents reuse one connection pool"""
+    return ChatOpenAI(temperature=temperature, model=model)
+
+
+@functools.lru_cache(maxsize=1)
+def _splitter() -> RecursiveCharacterTextSplitter:
+    """Shared text splitter (stateless, so one instance serves every agent)"""
+    return RecursiveCharacterTextSplitter(
+        chunk_size=1000,
+        chunk_overlap=200
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _embeddings() -> OpenAIEmbeddings:
+    """Shared embeddings client, created on first use"""
+    return OpenAIEmbeddings()
+
+
+_SEARCH_PROMPT = PromptTemplate.from_template(
+    "Based on the following context, answer the question.\n\n"
+    "Context: {context}\n\nQuestion: {query}\n\nAnswer:"
+)
+
+
+def _content_hash(text: str) -> bytes:
+    """Stable key for a chunk, used to skip re-embedding seen content"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+# Written next to a saved FAISS index: hex content hashes of its chunks
+_HASHES_FILE = "content_hashes.json"
+
+
 class ResearchAgent:
     """Agent that conducts research using RAG"""
     
-    def __init__(self, documents: List[str] = None):
-        self.llm = ChatOpenAI(temperature=0.7, model="gpt-3.5-turbo")
+    def __init__(self, documents: List[str] = None, index_path: Optional[str] = None,
+                 allow_dangerous_deserialization: bool = False):
+        self.llm = _chat_llm()
         self.vectorstore = None
+        self.index_path = index_path
+        self._doc_hashes: Set[bytes] = set()
+        
+        # Reuse a previously saved index instead of re-embedding everything.
+        # The docstore is pickled, so loading it must be opted into explicitly
+        # (FAISS.load_local raises ValueError otherwise).
+        if index_path and os.path.isdir(index_path):
+            self.vectorstore = FAISS.load_local(
+                index_path, _embeddings(),
+                allow_dangerous_deserialization=allow_dangerous_deserialization
+            )
+            self._doc_hashes = self._load_doc_hashes()
         
         if documents:
             self.setup_vectorstore(documents)
     
     def setup_vectorstore(self, documents: List[str]):
-        """Initialize vector store with documents"""
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200
-        )
-        texts = text_splitter.create_documents(documents)
-        
-        embeddings = OpenAIEmbeddings()
-        self.vectorstore = FAISS.from_documents(texts, embeddings)
+        """Add documents to the vector store, embedding only unseen chunks"""
+        texts = _splitter().create_documents(documents)
+        
+        # Staged locally so a failed embedding call leaves nothing recorded
+        new_texts = []
+        new_hashes: Set[bytes] = set()
+        for text in texts:
+            key = _content_hash(text.page_content)
+            if key not in self._doc_hashes and key not in new_hashes:
+                new_hashes.add(key)
+                new_texts.append(text)
+        if not new_texts:
+            return
+        
+        if self.vectorstore is None:
+            self.vectorstore = FAISS.from_documents(new_texts, _embeddings())
+        else:
+            self.vectorstore.add_documents(new_texts)
+        self._doc_hashes |= new_hashes
+        
+        if self.index_path:
+            self.vectorstore.save_local(self.index_path)
+            with open(os.path.join(self.index_path, _HASHES_FILE), "w") as f:
+                json.dump(sorted(key.hex() for key in self._doc_hashes), f)
+    
+    def _load_doc_hashes(self) -> Set[bytes]:
+        """Content hashes of the loaded index, from its sidecar file when present"""
+        sidecar = os.path.join(self.index_path, _HASHES_FILE)
+        if os.path.isfile(sidecar):
+            with open(sidecar) as f:
+                return {bytes.fromhex(key) for key in json.load(f)}
+        
+        # Index saved without a sidecar: hash the stored chunks once
+        docstore = self.vectorstore.docstore
+        return {
+            _content_hash(docstore.search(doc_id).page_content)
+            for doc_id in self.vectorstore.index_to_docstore_id.values()
+        }
     
     def search(self, query: str) -> str:
         """Search documents for relevant information"""
         if not self.vectorstore:
             return "No documents loaded. Please provide documents first."
         
-        docs = self.vectorstore.similarity_search(query, k=3)
-        context = "\n".join([doc.page_content for doc in docs])
+        return self.search_batch([query])[0]
+    
+    def search_batch(self, queries: List[str], k: int = 3) -> List[str]:
+        """Answer several questions with one embedding call and one FAISS probe"""
+        if not queries:
+            return []
+        if not self.vectorstore:
+            return ["No documents loaded. Please provide documents first."] * len(queries)
         
-        prompt = f"""Based on the following context, answer the question.
+        vectors = np.asarray(self.vectorstore.embeddings.embed_documents(queries), dtype=np.float32)
+        # Same query normalization similarity_search applies for cosine-style stores
+        if getattr(self.vectorstore, "_normalize_L2", False):
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors /= np.where(norms > 0, norms, 1.0)
+        _, indices = self.vectorstore.index.search(vectors, k)
         
-Context: {context}
-
-Question: {query}
-
-Answer:"""
+        prompts = []
+        for query, row in zip(queries, indices):
+            # FAISS pads with -1 when the index holds fewer than k vectors
+            docs = [self.vectorstore.docstore.search(self.vectorstore.index_to_docstore_id[int(i)])
+                    for i in row if i != -1]
+            context = "\n".join([doc.page_content for doc in docs])
+            
+            prompts.append(_SEARCH_PROMPT.format(context=context, query=query))
         
-        response = self.llm.invoke(prompt)
-        return response.content
+        # batch() issues the completions concurrently
+        responses = self.llm.batch(prompts)
+        return [response.content for response in responses]
 
 
 class WritingAgent:
     """Agent that formats and writes output"""
     
     def __init__(self):
-        self.llm = ChatOpenAI(temperature=0.7, model="gpt-3.5-turbo")
+        self.llm = _chat_llm()
     
     def write_report(self, research_data: str, topic: str) -> str:
         """Format research into professional report"""
@@ -86,6 +183,7 @@ class AgenticSystem:
     def __init__(self):
         self.research_agent = ResearchAgent()
         self.writing_agent = WritingAgent()
+        self._last_documents: Optional[List[str]] = None
     
     def run_workflow(self, topic: str, documents: List[str] = None) -> Dict[str, str]:
         """Execute full agentic workflow"""
@@ -93,9 +191,10 @@ class AgenticSystem:
         print(f"\n🔍 Starting research on: {topic}\n")
         
         # Step 1: Setup knowledge base if documents provided
-        if documents:
+        if documents and documents != self._last_documents:
             print("📚 Loading documents into vector store...")
             self.research_agent.setup_vectorstore(documents)
+            self._last_documents = list(documents)
         
         # Step 2: Research
         print("🤖 Research agent gathering information...")
@@ -0,0 +1,26 @@
+"""Blueprint version bumps during Architect Prime RSIP refinement."""
+
+import pytest
+
+from agents.architect_prime import ArchitectPrimeAgent, Blueprint, TechPillar, _bump_version
+
+
+@pytest.mark.parametrize("version, steps, expected", [
+    ("2.0", 1, "2.1"),
+    ("2.9", 1, "3.0"),
+    ("10.5", 7, "11.2"),
+    ("2", 3, "2.3"),
+])
+def test_bump_version(version, steps, expected):
+    assert _bump_version(version, steps) == expected
+
+
+def test_refine_reads_version_set_after_construction():
+    agent = ArchitectPrimeAgent()
+    agent.design_phase = 1
+    bp = Blueprint("ZK-002", TechPillar.ZK_EVM, pseudoscience_check_passed=True)
+    bp.version = "3.0"
+
+    agent._rsip_refine_blueprints((bp,))
+
+    assert bp.version == "3.1"
@@ -0,0 +1,53 @@
+"""Multi-hop arbitrage cycle detection in the DeFi agent."""
+
+import pytest
+
+from agents.defi_agent import AgentConfig, ArbitrageOpportunity, DeFiAgent
+
+
+def _leg(asset, buy, sell, gain_pct, fees_pct=0.0):
+    return ArbitrageOpportunity(
+        asset=asset,
+        buy_exchange=buy,
+        sell_exchange=sell,
+        buy_price=100.0,
+        sell_price=100.0 * (1 + gain_pct / 100),
+        spread_pct=gain_pct,
+        estimated_fees_pct=fees_pct,
+        net_profit_pct=gain_pct - fees_pct,
+        liquidity_depth=500_000.0,
+        is_cross_chain=False,
+    )
+
+
+def test_single_asset_cycle_is_found():
+    agent = DeFiAgent()
+    legs = [_leg("ETH", "a", "b", 1.0), _leg("ETH", "b", "c", 1.0), _leg("ETH", "c", "a", 1.0)]
+
+    cycles = agent._find_arbitrage_cycles(legs)
+
+    assert len(cycles) == 1
+    assert cycles[0]["asset"] == "ETH"
+    assert {id(leg) for leg in cycles[0]["legs"]} == {id(leg) for leg in legs}
+    assert cycles[0]["net_profit_pct"] == pytest.approx((1.01 ** 3 - 1) * 100)
+
+
+def test_mixed_asset_legs_do_not_form_a_cycle():
+    agent = DeFiAgent()
+    legs = [_leg("ETH", "a", "b", 2.0), _leg("BTC", "b", "a", 2.0)]
+
+    assert agent._find_arbitrage_cycles(legs) == []
+
+
+def test_same_venue_leg_is_not_a_cycle():
+    agent = DeFiAgent()
+    legs = [_leg("ETH", "a", "a", 5.0), _leg("ETH", "b", "b", 5.0)]
+
+    assert agent._find_arbitrage_cycles(legs) == []
+
+
+def test_cycles_below_min_profit_are_dropped():
+    legs = [_leg("ETH", "a", "b", 0.05), _leg("ETH", "b", "a", 0.05)]
+
+    assert len(DeFiAgent(AgentConfig(min_arbitrage_profit_pct=0.05))._find_arbitrage_cycles(legs)) == 1
+    assert DeFiAgent(AgentConfig(min_arbitrage_profit_pct=0.15))._find_arbitrage_cycles(legs) == []
@@ -0,0 +1,44 @@
+"""Gating and execution of selected ToT branches in the DeFi agent."""
+
+import threading
+from datetime import datetime
+
+from agents.defi_agent import AgentConfig, DeFiAgent, Position, StrategyType, TaskType
+
+
+def _risky_agent():
+    agent = DeFiAgent(AgentConfig(initial_capital_usdc=2000.0, max_portfolio_risk_score=5.0))
+    now = datetime.utcnow()
+    agent._add_position(Position("p0", StrategyType.YIELD_FARMING, "aave", "ethereum",
+                                 1000.0, 1000.0, 0.0, 0.0, 9.0, now, now))
+    agent._add_position(Position("p1", StrategyType.YIELD_FARMING, "aave", "ethereum",
+                                 1000.0, 1000.0, 0.0, 0.0, 2.0, now, now))
+    return agent
+
+
+def _decisions(n):
+    branch = lambda i: {"action": f"arb{i}", "expected_return": 1.0, "capital_required": 1.0}
+    return {TaskType.ARBITRAGE_EXECUTION: {"selected": [branch(i) for i in range(n)]}}
+
+
+def test_failed_risk_check_skips_the_first_selected_branch():
+    agent = _risky_agent()
+    results = agent._execute_decisions(_decisions(4))
+
+    assert results == {"executed": 3, "skipped": 1, "errors": 0}
+    assert [tx["action"] for tx in agent.iter_transactions()] == ["arb1", "arb2", "arb3"]
+    assert [p.position_id for p in agent.positions] == ["p1"]
+    agent.close()
+
+
+def test_risk_gate_runs_on_the_calling_thread(monkeypatch):
+    agent = _risky_agent()
+    gate_threads = []
+    check = agent.check_risk_thresholds
+    monkeypatch.setattr(agent, "check_risk_thresholds",
+                        lambda: gate_threads.append(threading.current_thread()) or check())
+
+    agent._execute_decisions(_decisions(4))
+
+    assert gate_threads and set(gate_threads) == {threading.current_thread()}
+    agent.close()
@@ -0,0 +1,41 @@
+"""Position tracking and the DeFi agent's SoA mirrors."""
+
+import dataclasses
+from datetime import datetime
+
+import pytest
+
+from agents.defi_agent import DeFiAgent, Position, StrategyType
+
+
+def _position(position_id, value=1000.0, risk=4.5):
+    now = datetime.utcnow()
+    return Position(position_id, StrategyType.YIELD_FARMING, "aave", "ethereum",
+                    value, value, 0.0, 0.0, risk, now, now)
+
+
+def test_positions_cannot_be_mutated_in_place():
+    agent = DeFiAgent()
+    agent._add_position(_position("p0"))
+
+    with pytest.raises(AttributeError):
+        agent.positions.append(_position("p1"))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        agent.positions[0].current_value_usdc = 0.0
+
+
+def test_update_position_rewrites_the_mirror_row():
+    agent = DeFiAgent()
+    agent._add_position(_position("p0"))
+    agent._add_position(_position("p1", value=2000.0, risk=2.0))
+
+    agent._update_position("p0", current_value_usdc=0.0, pnl_usdc=-5000.0)
+
+    assert agent.positions[0].current_value_usdc == 0.0
+    assert agent._calculate_portfolio_risk() == pytest.approx(2.0 * 2000.0 / agent.portfolio_value)
+    assert agent._generate_report().total_pnl_usdc == -5000.0
+
+
+def test_update_unknown_position_raises():
+    with pytest.raises(KeyError):
+        DeFiAgent()._update_position("missing", pnl_usdc=1.0)
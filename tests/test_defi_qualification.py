@@ -0,0 +1,28 @@
+"""Vectorized yield qualification and confidence kernels in the DeFi agent."""
+
+import pytest
+
+from agents.defi_agent import (
+    DeFiAgent, YieldOpportunity, _qualify_yield, _yield_columns, _yield_confidence,
+)
+
+
+def _opp(risk_score=3.0, tvl=50_000_000.0, security_score=8.0):
+    return YieldOpportunity("aave", "pool", "ethereum", 25.0, tvl, risk_score,
+                            security_score, 0.0, ("ETH", "USDC"))
+
+
+def test_risk_just_above_the_limit_does_not_qualify():
+    apy, risk, sec, _ = _yield_columns([_opp(risk_score=5.0000001), _opp(risk_score=5.0)])
+
+    mask = _qualify_yield(apy, risk, sec, min_apy=0.0, max_risk=5.0, min_sec=0.0)
+
+    assert mask.tolist() == [False, True]
+
+
+@pytest.mark.parametrize("tvl", [10_000_000.0, 10_000_000.4, 10_000_001.0])
+def test_column_confidence_matches_scalar_confidence(tvl):
+    opp = _opp(tvl=tvl)
+    _, _, sec, tvl_col = _yield_columns([opp])
+
+    assert _yield_confidence(sec, tvl_col)[0] == pytest.approx(DeFiAgent()._calculate_confidence(opp))
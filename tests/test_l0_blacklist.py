@@ -0,0 +1,49 @@
+"""RSIP feedback into the L0 orchestrator's ToT branch blacklist."""
+
+from agents.l0_orchestrator import L0OrchestratorAgent, OrchestratorConfig
+
+FEE_ACTION = "Increase cross-chain fees by 1 bps"
+
+
+class _MissingFeeAgent(L0OrchestratorAgent):
+    """Realizes every pathway's estimate except the fee increase, which earns nothing."""
+
+    def _execute_branch(self, task_type, branch):
+        return 0.0 if branch["action"] == FEE_ACTION else branch["expected_revenue_gain"]
+
+
+def _revenue_actions(agent):
+    tasks = agent.cad_decompose_strategy(agent.rag_scan_ecosystem())
+    return [b["action"] for b in agent.tot_evaluate_branches(tasks)["revenue_optimization"]["selected"]]
+
+
+def test_underperforming_pathway_is_dropped_from_tot():
+    agent = _MissingFeeAgent(OrchestratorConfig(branch_penalty_threshold=2.0))
+    agent.is_operational = True
+    assert FEE_ACTION in _revenue_actions(agent)
+
+    # Penalty accrues once per missed cycle and must exceed the threshold
+    for _ in range(3):
+        agent.execute_cycle()
+
+    assert _revenue_actions(agent) == ["Deploy new data access oracle"]
+
+
+def test_pathways_meeting_estimates_are_kept():
+    agent = _MissingFeeAgent(OrchestratorConfig(branch_penalty_threshold=2.0))
+    agent.is_operational = True
+
+    for _ in range(3):
+        agent.execute_cycle()
+
+    assert "Deploy new data access oracle" in _revenue_actions(agent)
+
+
+def test_unconnected_executor_leaves_cycle_idle():
+    agent = L0OrchestratorAgent()
+    agent.is_operational = True
+
+    agent.execute_cycle()
+
+    assert agent.cycle_count == 0
+    assert agent._branch_blacklist == {}
@@ -0,0 +1,39 @@
+"""Network state tracking and the L0 orchestrator's packed mirror."""
+
+import dataclasses
+
+import pytest
+
+from agents.l0_orchestrator import ControlLevel, L0OrchestratorAgent, NetworkState
+
+
+def _state(level):
+    return NetworkState("chain-a", "L1", 100, 10, 1_000.0, 100.0, 1_000.0, 100.0, level)
+
+
+def _stake_actions(agent):
+    tasks = agent.cad_decompose_strategy(agent.rag_scan_ecosystem())
+    return [b["action"] for b in agent.tot_evaluate_branches(tasks)["network_control_enhancement"]["selected"]]
+
+
+def test_network_state_cannot_be_mutated_in_place():
+    agent = L0OrchestratorAgent()
+    state = _state(ControlLevel.INFLUENCE)
+    agent._set_network_state(state)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        state.control_level = ControlLevel.DOMINANCE
+    with pytest.raises(TypeError):
+        agent.network_states["chain-b"] = state
+
+
+def test_recorded_state_change_reaches_tot():
+    agent = L0OrchestratorAgent()
+    state = _state(ControlLevel.INFLUENCE)
+    agent._set_network_state(state)
+    assert _stake_actions(agent) == ["Acquire 5% more stake in chain-a"]
+
+    agent._set_network_state(dataclasses.replace(state, control_level=ControlLevel.DOMINANCE))
+
+    assert _stake_actions(agent) == []
+    assert agent.network_states["chain-a"].control_level is ControlLevel.DOMINANCE
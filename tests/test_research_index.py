@@ -0,0 +1,117 @@
+"""Saving and reloading the ResearchAgent's FAISS index."""
+
+import os
+
+import numpy as np
+import pytest
+
+pytest.importorskip("langchain_community")
+pytest.importorskip("faiss")
+
+from langchain_community.embeddings import DeterministicFakeEmbedding
+
+import main
+
+DOCS = [
+    "Agentic AI systems plan, reason, and execute tasks.",
+    "RAG combines language models with external knowledge retrieval.",
+]
+
+
+class _RecordingLLM:
+    """Stands in for the chat client; keeps the prompts it was sent."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def batch(self, prompts):
+        self.prompts.extend(prompts)
+        return []
+
+
+class _SpyIndex:
+    """Wraps a FAISS index and keeps a copy of every query matrix it is probed with."""
+
+    def __init__(self, index):
+        self.index = index
+        self.probes = []
+
+    def search(self, x, k):
+        self.probes.append(x.copy())
+        return self.index.search(x, k)
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    monkeypatch.setattr(main, "_embeddings", lambda: DeterministicFakeEmbedding(size=16))
+    monkeypatch.setattr(main, "_chat_llm", lambda: None)
+
+
+def test_round_trip_restores_hashes_without_reembedding(tmp_path):
+    index_path = str(tmp_path / "index")
+    saved = main.ResearchAgent(DOCS, index_path=index_path)
+    assert os.path.isfile(os.path.join(index_path, main._HASHES_FILE))
+
+    loaded = main.ResearchAgent(index_path=index_path, allow_dangerous_deserialization=True)
+    assert loaded._doc_hashes == saved._doc_hashes
+
+    loaded.setup_vectorstore(DOCS)
+    assert loaded.vectorstore.index.ntotal == saved.vectorstore.index.ntotal
+
+
+def test_index_without_sidecar_is_rehashed(tmp_path):
+    index_path = str(tmp_path / "index")
+    saved = main.ResearchAgent(DOCS, index_path=index_path)
+    os.remove(os.path.join(index_path, main._HASHES_FILE))
+
+    loaded = main.ResearchAgent(index_path=index_path, allow_dangerous_deserialization=True)
+    assert loaded._doc_hashes == saved._doc_hashes
+
+
+def test_loading_requires_explicit_opt_in(tmp_path):
+    index_path = str(tmp_path / "index")
+    main.ResearchAgent(DOCS, index_path=index_path)
+
+    with pytest.raises(ValueError):
+        main.ResearchAgent(index_path=index_path)
+
+
+def test_failed_embedding_keeps_documents_for_retry(monkeypatch):
+    calls = []
+
+    class FlakyEmbedding(DeterministicFakeEmbedding):
+        def embed_documents(self, texts):
+            calls.append(len(texts))
+            if len(calls) == 1:
+                raise ConnectionError("embedding service unavailable")
+            return super().embed_documents(texts)
+
+    monkeypatch.setattr(main, "_embeddings", lambda: FlakyEmbedding(size=16))
+    agent = main.ResearchAgent()
+
+    with pytest.raises(ConnectionError):
+        agent.setup_vectorstore(DOCS)
+    assert agent.vectorstore is None
+    assert agent._doc_hashes == set()
+
+    agent.setup_vectorstore(DOCS)
+    assert agent.vectorstore.index.ntotal == len(DOCS)
+
+
+def test_search_batch_normalizes_queries_like_similarity_search():
+    agent = main.ResearchAgent()
+    agent.vectorstore = main.FAISS.from_texts(
+        DOCS + ["Multi-agent systems coordinate specialized agents."],
+        DeterministicFakeEmbedding(size=16), normalize_L2=True,
+    )
+    agent.llm = _RecordingLLM()
+    index = agent.vectorstore.index
+    agent.vectorstore.index = spy = _SpyIndex(index)
+
+    assert agent.search_batch([]) == []
+    agent.search_batch(["retrieval"], k=2)
+
+    assert np.allclose(np.linalg.norm(spy.probes[0], axis=1), 1.0)
+    agent.vectorstore.index = index
+    expected = "\n".join(doc.page_content for doc in agent.vectorstore.similarity_search("retrieval", k=2))
+    assert f"Context: {expected}\n" in agent.llm.prompts[0]